@@ -0,0 +1,72 @@
+"""
+Sorting and comparing TonalVectors against vectors, tuples and ints.
+
+Compares TryExceptVector, a copy of the earlier comparison methods
+which coerced with int() and caught TypeError, with the dispatched
+comparisons, and with sorting by TonalVector.sort_key.
+
+    python benchmarks/bench_comparisons.py --notes 100000
+"""
+
+import argparse
+
+from common import best_time, random_score, report
+
+from omk_core import TonalVector
+from omk_core.tonal_algebra import tonal_arithmetic as ta
+
+
+class TryExceptVector(tuple):
+    def __int__(self):
+        return ta.tonal_int(self)
+
+    def __lt__(self, x):
+        try:
+            return int(self) < int(x)
+        except TypeError:
+            return int(self) < ta.tonal_int(x)
+
+    def __gt__(self, x):
+        try:
+            return int(self) > int(x)
+        except TypeError:
+            return int(self) > ta.tonal_int(x)
+
+    def __eq__(self, x):
+        if type(self) == type(x):
+            return tuple(self) == tuple(x)
+        return tuple(self) == x or int(self) == x
+
+    __hash__ = tuple.__hash__
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=100000)
+    args = parser.parse_args()
+
+    score = random_score(args.notes)
+    old = [TryExceptVector(x) for x in score]
+    new = [TonalVector(x) for x in score]
+    others = [x if i % 2 else ta.tonal_int(x) for i, x in enumerate(random_score(args.notes, seed=1))]
+
+    cases = [
+        ("sorted(), try/except", lambda: sorted(old)),
+        ("sorted(), dispatched", lambda: sorted(new)),
+        ("sorted(key=sort_key)", lambda: sorted(new, key=TonalVector.sort_key)),
+        ("< tuple or int, try/except", lambda: [a < b for a, b in zip(old, others)]),
+        ("< tuple or int, dispatched", lambda: [a < b for a, b in zip(new, others)]),
+        ("== tuple or int, try/except", lambda: [a == b for a, b in zip(old, others)]),
+        ("== tuple or int, dispatched", lambda: [a == b for a, b in zip(new, others)]),
+    ]
+
+    rows = []
+    for name, func in cases:
+        t = best_time(func)
+        rows.append([name, "{:.3f} s".format(t), "{:.0f} ns".format(t / args.notes * 1e9)])
+
+    report(rows, ["operation", "total", "per note"])
+
+
+if __name__ == "__main__":
+    main()
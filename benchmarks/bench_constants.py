@@ -0,0 +1,46 @@
+"""
+Attribute access on the MS and AC tables, as read by tonal_int, _get_quality and Note.
+
+Compares the frozen records in definitions.constants with
+the DotMaps they replaced (when dotmap is installed).
+
+    python benchmarks/bench_constants.py
+"""
+
+import argparse
+
+from common import best_time, report
+
+from omk_core.definitions.constants import MS, AC
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--number", type=int, default=1000000)
+    args = parser.parse_args()
+
+    tables = [("records", MS, AC)]
+    try:
+        from dotmap import DotMap
+    except ImportError:
+        print("dotmap is not installed; skipping the DotMap comparison")
+    else:
+        tables.insert(0, ("DotMap", [DotMap(dict(x)) for x in MS], {k: DotMap(dict(x)) for k, x in AC.items()}))
+
+    rows = []
+    for label, ms, ac in tables:
+        degree, accidental = ms[4], ac[-1]
+        for name, func in (
+            ("MS[d].c", lambda: degree.c),
+            ("MS[d].q", lambda: degree.q),
+            ("MS[d].ln", lambda: degree.ln),
+            ("AC[m].u", lambda: accidental.u),
+        ):
+            t = best_time(func, number=args.number)
+            rows.append([label, name, "{:.1f} ns".format(t / args.number * 1e9)])
+
+    report(rows, ["table", "access", "per access"])
+
+
+if __name__ == "__main__":
+    main()
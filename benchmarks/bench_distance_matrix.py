@@ -0,0 +1,64 @@
+"""
+Pairwise distances and interval-class vectors for pitch sets, as used in set-theory analysis.
+
+Compares pairwise_abs_diff, a copy of the earlier tonal_abs_diff called once
+per pair, with tonal_abs_diff_matrix and the TonalArray (NumPy) version.
+
+    python benchmarks/bench_distance_matrix.py --sets 1000 --size 12
+"""
+
+import argparse
+
+from common import best_time, random_score, report
+
+import omk_core as omk
+from omk_core.tonal_algebra import tonal_arithmetic as ta
+
+
+def uncached_abs_diff(x, y):
+    x, y = ta.qualify_octave_as_needed(x, y)
+    a = ta.tonal_abs_val(ta.tonal_diff(x, y))
+    b = ta.tonal_abs_val(ta.tonal_diff(y, x))
+    return ta._tonal_modulo(ta.tonal_lesser_of(a, b))
+
+
+def pairwise_abs_diff(xs):
+    return [[uncached_abs_diff(x, y) for y in xs] for x in xs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sets", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=12)
+    args = parser.parse_args()
+
+    notes = random_score(args.sets * args.size)
+    sets = [notes[i:i + args.size] for i in range(0, len(notes), args.size)]
+    assert pairwise_abs_diff(sets[0]) == omk.tonal_abs_diff_matrix(sets[0])
+
+    cases = [
+        ("per pair, uncached", lambda: [pairwise_abs_diff(s) for s in sets]),
+        ("tonal_abs_diff_matrix", lambda: [omk.tonal_abs_diff_matrix(s) for s in sets]),
+        ("interval_class_vector", lambda: [omk.interval_class_vector(s) for s in sets]),
+    ]
+    try:
+        arrays = [omk.TonalArray.from_vectors(s) for s in sets]
+    except ImportError:
+        print("numpy is not installed; skipping TonalArray")
+    else:
+        cases += [
+            ("TonalArray.distance_matrix", lambda: [a.distance_matrix() for a in arrays]),
+            ("TonalArray.interval_class_vector", lambda: [a.interval_class_vector() for a in arrays]),
+        ]
+
+    rows = []
+    for name, func in cases:
+        t = best_time(func)
+        rows.append([name, "{:.3f} s".format(t), "{:.1f} us".format(t / args.sets * 1e6)])
+
+    print("{} sets of {} pitches".format(args.sets, args.size))
+    report(rows, ["implementation", "total", "per set"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Import time of omk_core, measured with `python -X importtime`.
+
+Reports the cumulative import time and the slowest modules,
+and exits with status 1 if the import takes longer than --max-ms
+or loads any of the third party packages that should be lazy.
+
+    python benchmarks/bench_import_time.py --max-ms 150
+"""
+
+import argparse
+import subprocess
+import sys
+
+from common import report
+
+
+LAZY_PACKAGES = ['music21', 'numpy', 'attr', 'dotmap']
+
+
+def import_times(statement):
+    """Returns {module: (self us, cumulative us)} for a fresh interpreter running statement."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--statement", default="import omk_core")
+    parser.add_argument("--max-ms", type=float, default=150.0)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [import_times(args.statement) for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times["omk_core"][1])
+    total_ms = best["omk_core"][1] / 1000
+
+    slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    report([[name, "{:.1f} ms".format(s / 1000), "{:.1f} ms".format(c / 1000)]
+            for name, (s, c) in slowest], ["module", "self", "cumulative"])
+    print()
+    print("{}: {:.1f} ms (best of {})".format(args.statement, total_ms, args.runs))
+
+    failures = []
+    loaded = sorted(p for p in LAZY_PACKAGES if p in best)
+    if loaded:
+        failures.append("loaded lazy packages: {}".format(", ".join(loaded)))
+    if total_ms > args.max_ms:
+        failures.append("took longer than {:.0f} ms".format(args.max_ms))
+
+    for failure in failures:
+        print("REGRESSION: " + failure)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Effect of the TonalVector interning pool on a tonal_sum loop.
+
+Runs the same transposition loop over a corpus with the octave-qualified pool
+disabled and enabled, and reports time, peak memory and distinct objects.
+
+    python benchmarks/bench_interning.py --notes 200000
+"""
+
+import argparse
+
+from common import best_time, peak_memory, random_score, report
+
+from omk_core import TonalVector
+from omk_core.tonal_algebra import tonal_arithmetic as ta
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=200000)
+    parser.add_argument("--pool-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    corpus = random_score(args.notes)
+    step = (2, 4)
+    transpose = lambda: [TonalVector(ta.tonal_sum(x, step)) for x in corpus]
+    rows = []
+
+    for label, size in (("no pool", 0), ("pool", args.pool_size)):
+        TonalVector.pool_clear()
+        TonalVector.set_pool_size(size)
+        vectors, peak = peak_memory(transpose)
+        distinct = len(set(map(id, vectors)))
+        del vectors
+        rows.append([
+            label,
+            "{:.3f} s".format(best_time(transpose)),
+            "{:.1f} MiB".format(peak / 2**20),
+            distinct,
+            TonalVector.pool_info(),
+        ])
+
+    print("{} notes".format(args.notes))
+    report(rows, ["pool", "time", "peak memory", "distinct objects", "pool info"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Interval quality lookup, as done whenever a vector's .interval view is built.
+
+Compares dispatched_quality, a copy of the singledispatch path that
+recomputed the modifier and dispatched again on the quality number,
+with the (d, c) quality table.
+
+    python benchmarks/bench_interval_quality.py --notes 1000000
+"""
+
+import argparse
+
+from common import best_time, random_score, report
+
+from omk_core import TonalVector
+from omk_core.definitions.constants import MS, C_LEN
+from omk_core.tonal_algebra import interval_quality as iq
+
+
+def dispatched_quality(v):
+    d, c = v[0], v[1]
+    d_val = MS[d]
+    modifier = c - d_val.c
+    base_q_val = d_val.q
+    if abs(modifier) > 4:
+        if c < d_val.c:
+            d_val_c = d_val.c - C_LEN
+        if c > d_val.c:
+            d_val_c = d_val.c + C_LEN
+        modifier = c - d_val_c
+    if modifier < 0:
+        base_q_val = -base_q_val
+    return iq._get_quality(base_q_val + modifier)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=1000000)
+    args = parser.parse_args()
+
+    score = [TonalVector(x) for x in random_score(args.notes)]
+    assert all(dispatched_quality(v) is iq._vector_quality(v) for v in score[:1000])
+
+    cases = [
+        ("copied reference", lambda: [dispatched_quality(v) for v in score]),
+        ("_get_quality(v)", lambda: [iq._get_quality(v) for v in score]),
+        ("quality table", lambda: [iq._vector_quality(v) for v in score]),
+        ("TonalVector.Interval(v)", lambda: [TonalVector.Interval(v) for v in score]),
+    ]
+
+    rows = []
+    for name, func in cases:
+        t = best_time(func)
+        rows.append([name, "{:.3f} s".format(t), "{:.0f} ns".format(t / args.notes * 1e9)])
+
+    report(rows, ["lookup", "total", "per vector"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+The power-of-two and prime helpers in utils.math, before and after the exact versions.
+
+Each helper runs over the NoteLengths and tuplet numbers that repr(),
+undot() and untuple() pass it. The "before" rows are the float-based and
+looping reference_* helpers in common.py, and the primes rows take the
+first few hundred primes above 10**6.
+
+    python benchmarks/bench_math.py --number 10
+"""
+
+import argparse
+import itertools
+
+from common import (best_time, report, reference_pow2_floor_frac, reference_is_pow2,
+                    reference_divide_by_largest_pow2_factor, reference_primes)
+
+from omk_core import NoteLength
+from omk_core.utils import math as um
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    lengths = ([NoteLength(1, 2**n) for n in range(8)] + [NoteLength(1, 2**n).dot(d) for n in range(8) for d in (1, 2, 3)]
+               + [NoteLength.TupletMember(NoteLength(1, 2**n), tt) for n in range(8) for tt in range(3, 32)])
+    tuplets = [tt for tt in range(3, 1024) if tt & (tt - 1)]
+    n_primes = 500
+
+    cases = [
+        ("pow2_floor_frac", len(lengths),
+         lambda: [reference_pow2_floor_frac(x) for x in lengths], lambda: [um.pow2_floor_frac(x) for x in lengths]),
+        ("is_pow2", len(lengths),
+         lambda: [reference_is_pow2(x) for x in lengths], lambda: [um.is_pow2(x) for x in lengths]),
+        ("divide_by_largest_pow2_factor", len(tuplets),
+         lambda: [reference_divide_by_largest_pow2_factor(x) for x in tuplets],
+         lambda: [um.divide_by_largest_pow2_factor(x) for x in tuplets]),
+        ("primes(10**6)", n_primes,
+         lambda: list(itertools.islice(reference_primes(10**6), n_primes)),
+         lambda: list(itertools.islice(um.primes(10**6), n_primes))),
+    ]
+
+    rows = []
+    for name, calls, before, after in cases:
+        assert before() == after(), name
+        t_before = best_time(before, number=args.number)
+        t_after = best_time(after, number=args.number)
+        rows.append([name, "{:.0f} ns".format(t_before / (calls * args.number) * 1e9),
+                     "{:.0f} ns".format(t_after / (calls * args.number) * 1e9), "{:.1f}x".format(t_before / t_after)])
+
+    report(rows, ["helper", "before", "after", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
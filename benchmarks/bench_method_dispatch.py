@@ -0,0 +1,67 @@
+"""
+Per-call overhead of methoddispatch, as used by the interval quality and comparison generics.
+
+Compares it with functools.singledispatchmethod on an exact registered type,
+a subclass resolved through the MRO, and the default implementation.
+
+    python benchmarks/bench_method_dispatch.py --number 1000000
+"""
+
+import argparse
+import functools
+
+from common import best_time, report
+
+from omk_core import TonalVector
+from omk_core.utils.method_dispatch import methoddispatch
+
+
+class Ours():
+
+    @methoddispatch
+    def f(self, x):
+        return x
+
+    @f.register(int)
+    def _(self, x):
+        return x
+
+    @f.register(tuple)
+    def _(self, x):
+        return x
+
+
+class Stdlib():
+
+    @functools.singledispatchmethod
+    def f(self, x):
+        return x
+
+    @f.register(int)
+    def _(self, x):
+        return x
+
+    @f.register(tuple)
+    def _(self, x):
+        return x
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--number", type=int, default=1000000)
+    args = parser.parse_args()
+
+    arguments = [("int", 3), ("tuple subclass", TonalVector((2, 4))), ("default (str)", "x")]
+
+    rows = []
+    for label, obj in (("methoddispatch", Ours()), ("singledispatchmethod", Stdlib())):
+        for name, x in arguments:
+            t = best_time(lambda: obj.f(x), number=args.number)
+            rows.append([label, name, "{:.0f} ns".format(t / args.number * 1e9)])
+
+    print(Ours.f.cache_info())
+    report(rows, ["generic", "argument", "per call"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Batch half step and MIDI conversion, as used by pitch histograms and range checks.
+
+Compares a per-note loop over the general tonal_int implementation
+with the table-driven batch functions and TonalArray.
+
+    python benchmarks/bench_midi.py --notes 1000000
+"""
+
+import argparse
+import collections
+
+from common import best_time, random_score, report
+
+import omk_core as omk
+from omk_core.tonal_algebra import tonal_arithmetic as ta
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=1000000)
+    args = parser.parse_args()
+
+    score = random_score(args.notes)
+    ints = omk.tonal_ints(score)
+
+    cases = [
+        ("per-note _tonal_int", lambda: [ta._tonal_int(x) + 60 for x in score]),
+        ("midi_numbers", lambda: omk.midi_numbers(score)),
+        ("tonal_from_midi", lambda: omk.tonal_from_midi([i + 60 for i in ints])),
+    ]
+    try:
+        array = omk.TonalArray.from_vectors(score)
+        cases += [
+            ("TonalArray.midi", array.midi),
+            ("TonalArray.from_midi", lambda: omk.TonalArray.from_midi(array.midi())),
+        ]
+    except AttributeError:
+        pass
+
+    rows = []
+    for name, func in cases:
+        t = best_time(func)
+        rows.append([name, "{:.3f} s".format(t), "{:.0f} ns".format(t / args.notes * 1e9)])
+
+    histogram = collections.Counter(omk.midi_numbers(score))
+    print("{} notes, MIDI range {}-{}".format(args.notes, min(histogram), max(histogram)))
+    report(rows, ["conversion", "total", "per note"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Placing relative-octave notes, as done by ly_rel8ve and relative Lilypond parsing.
+
+Compares reference_nearest_instance, the earlier implementation which
+built three candidates and a dict keyed by distance, with the closed form,
+and a per-note loop with tonal_resolve_octaves over a whole melody.
+
+    python benchmarks/bench_nearest_instance.py --notes 1000000
+"""
+
+import argparse
+
+from common import best_time, random_score, report, reference_nearest_instance
+
+import omk_core as omk
+
+
+def chained(func, start, melody):
+    result, prev = [], start
+    for y in melody:
+        prev = func(prev, y)
+        result.append(prev)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=1000000)
+    args = parser.parse_args()
+
+    melody = [(d, c) for d, c, _ in random_score(args.notes)]
+    start = (0, 0, 0)
+    assert chained(reference_nearest_instance, start, melody[:1000]) == omk.tonal_resolve_octaves(start, melody[:1000])
+
+    cases = [
+        ("candidates + dict", lambda: chained(reference_nearest_instance, start, melody)),
+        ("closed form", lambda: chained(omk.tonal_nearest_instance, start, melody)),
+        ("tonal_resolve_octaves", lambda: omk.tonal_resolve_octaves(start, melody)),
+    ]
+
+    rows = []
+    for name, func in cases:
+        t = best_time(func, repeat=1)
+        rows.append([name, "{:.3f} s".format(t), "{:.0f} ns".format(t / args.notes * 1e9)])
+
+    report(rows, ["implementation", "total", "per note"])
+
+
+if __name__ == "__main__":
+    main()
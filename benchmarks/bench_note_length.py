@@ -0,0 +1,60 @@
+"""
+Dot and tuplet detection and rendering over a corpus of durations.
+
+Compares reference_undot and reference_untuple, the earlier methods
+which summed dot() for each candidate dot count and tried each
+tuplet type from 3 up, with the closed forms on the numerator and
+denominator bits, and times repr() of each duration. Tuplet members are
+drawn from common tuplets (3, 5, 6, 7) and, for the large-tuplet rows,
+from tuplets up to 1023.
+
+    python benchmarks/bench_note_length.py --notes 100000
+"""
+
+import argparse
+import random
+
+from common import best_time, report, reference_undot, reference_untuple
+
+from omk_core import NoteLength
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    corpus = [NoteLength(1, 2**rng.randrange(0, 7)).dot(rng.choice([0, 0, 1, 1, 1, 2, 3]))
+              for _ in range(args.notes)]
+    tuplets = [NoteLength.TupletMember(NoteLength(1, 2**rng.randrange(0, 6)), rng.choice([3, 3, 3, 5, 6, 7]))
+               for _ in range(args.notes)]
+    large_tuplets = [NoteLength.TupletMember(NoteLength(1, 4), rng.randrange(3, 1024, 2))
+                     for _ in range(args.notes // 100)]
+    assert [reference_undot(x) for x in corpus[:1000]] == [x.undot() for x in corpus[:1000]]
+    assert [reference_untuple(x) for x in tuplets[:1000]] == [x.untuple() for x in tuplets[:1000]]
+    assert [reference_untuple(x) for x in large_tuplets[:100]] == [x.untuple() for x in large_tuplets[:100]]
+
+    cases = [
+        ("undot, loop", corpus, reference_undot),
+        ("undot, closed form", corpus, NoteLength.undot),
+        ("_can_undot, loop", corpus, lambda x: reference_undot(x) is not None),
+        ("_can_undot, closed form", corpus, NoteLength._can_undot),
+        ("untuple, loop", tuplets, reference_untuple),
+        ("untuple, closed form", tuplets, NoteLength.untuple),
+        ("untuple up to 1023, loop", large_tuplets, reference_untuple),
+        ("untuple up to 1023, closed form", large_tuplets, NoteLength.untuple),
+        ("repr, dotted", corpus, repr),
+        ("repr, tuplets", tuplets, repr),
+    ]
+
+    rows = []
+    for name, durations, func in cases:
+        t = best_time(lambda: [func(x) for x in durations], repeat=1)
+        rows.append([name, len(durations), "{:.3f} s".format(t), "{:.0f} ns".format(t / len(durations) * 1e9)])
+
+    report(rows, ["operation", "durations", "total", "per duration"])
+
+
+if __name__ == "__main__":
+    main()
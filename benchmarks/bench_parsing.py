@@ -0,0 +1,99 @@
+"""
+Pitch and interval string parsing over a large token list.
+
+Real inputs repeat a few hundred spellings, so the token list is drawn
+from a small vocabulary. Reports the scanning letter/modifier lookups
+against the reverse indexes, the scanning interval quality resolver against
+the alias index, and the uncached parsers against the cached ones.
+
+    python benchmarks/bench_parsing.py --tokens 1000000
+"""
+
+import argparse
+import random
+
+from common import best_time, report
+
+from omk_core.definitions.constants import MS, AC
+from omk_core.tonal_algebra import interval as i
+from omk_core.tonal_algebra import interval_quality as iq
+from omk_core.tonal_algebra import pitch as p
+
+
+LETTERS = "abcdefgABCDEFG"
+MODIFIERS = ["", "#", "b", "##", "bb", "sharp", "flat", "♯", "♭", "es", "is"]
+OCTAVES = ["", "0", "1", "2", "3", "4", "5", "-1", "'", "''", ","]
+INTERVALS = ["P1", "min2", "maj2", "min3", "maj3", "P4", "aug4", "dim5", "P5", "min6", "maj6", "min7", "maj7",
+             "m2", "M2", "m3", "M3", "A4", "d5", "m6", "M6", "m7", "M7",
+             "aug2, +1", "dim7, -1", "maj 3 +2"]
+
+
+def scanning_pitch_to_tuple(nstr):
+    """The parser as it was before the reverse indexes, scanning MS and AC on every call."""
+    note_re = p._note_parser.fullmatch(nstr)
+    n = note_re[1].lower()
+    m = note_re[2].lower() or ''
+    s = [x for x in MS if x.ln == n][0]
+    c = s.c + [key for key, strs in AC.items() if m in strs.values()][0]
+    o = p._octave_reader((s.d, c), note_re[3] or '')
+    if o is not None:
+        return (s.d, c, o)
+    return (s.d, c)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--tokens", type=int, default=1000000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    vocabulary = [l + m + o for l in LETTERS for m in MODIFIERS for o in OCTAVES]
+    notes = [rng.choice(vocabulary) for _ in range(args.tokens)]
+    intervals = [rng.choice(INTERVALS) for _ in range(args.tokens // 10)]
+
+    rows = []
+
+    t_scanning = best_time(lambda: [scanning_pitch_to_tuple(t) for t in notes], repeat=1)
+    t_indexed = best_time(lambda: [p._pitch_to_tuple(t) for t in notes], repeat=1)
+    rows.append([
+        "pitch_to_tuple lookups",
+        len(notes),
+        "{:.0f} ns (scan)".format(t_scanning / len(notes) * 1e9),
+        "{:.0f} ns (index)".format(t_indexed / len(notes) * 1e9),
+        "{:.1f}x".format(t_scanning / t_indexed),
+        "",
+    ])
+
+    qualities = [(m[1], int(m[2]) - 1) for m in (i._interval_parser.fullmatch(t) for t in intervals)]
+    t_scanning = best_time(lambda: [iq._scan_quality(q, d) for q, d in qualities], repeat=1)
+    t_indexed = best_time(lambda: [iq._str_quality(q, d) for q, d in qualities], repeat=1)
+    rows.append([
+        "interval quality lookups",
+        len(qualities),
+        "{:.0f} ns (scan)".format(t_scanning / len(qualities) * 1e9),
+        "{:.0f} ns (index)".format(t_indexed / len(qualities) * 1e9),
+        "{:.1f}x".format(t_scanning / t_indexed),
+        "",
+    ])
+
+    for name, tokens, uncached, cached, cache in (
+        ("pitch_to_tuple", notes, p._pitch_to_tuple, p.pitch_to_tuple, p.pitch_cache),
+        ("interval_to_tuple", intervals, i._interval_to_tuple, i.interval_to_tuple, i.interval_cache),
+    ):
+        cache.cache_clear()
+        t_uncached = best_time(lambda: [uncached(t) for t in tokens], repeat=1)
+        t_cached = best_time(lambda: [cached(t) for t in tokens], repeat=1)
+        rows.append([
+            name,
+            len(tokens),
+            "{:.0f} ns".format(t_uncached / len(tokens) * 1e9),
+            "{:.0f} ns".format(t_cached / len(tokens) * 1e9),
+            "{:.1f}x".format(t_uncached / t_cached),
+            cache.cache_info(),
+        ])
+
+    report(rows, ["parser", "tokens", "before", "after", "speedup", "cache info"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Note name rendering over a large score, as done when exporting to text formats.
+
+Compares rebuilt_unicode, a copy of the Note.unicode logic that
+recomputed the modifier and joined the name on every access,
+with the precomputed spelling tables and render_many.
+
+    python benchmarks/bench_rendering.py --notes 1000000
+"""
+
+import argparse
+
+from common import best_time, random_score, report
+
+import omk_core as omk
+from omk_core.definitions.constants import AC, C_LEN
+
+
+def rebuilt_unicode(v):
+    ustr = v._Q.ln.upper()
+    modifier = v.c - v._Q.c
+    if abs(modifier) > 4:
+        if v.c < v._Q.c:
+            modifier = v.c - (v._Q.c - C_LEN)
+        if v.c > v._Q.c:
+            modifier = v.c - (v._Q.c + C_LEN)
+    if modifier:
+        ustr = "".join([ustr, AC[modifier].u])
+    if v._has_octave:
+        ustr = "".join([ustr, str(v.o)])
+    return ustr
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=1000000)
+    args = parser.parse_args()
+
+    score = [omk.TonalVector(x) for x in random_score(args.notes)]
+    assert " ".join(rebuilt_unicode(v) for v in score) == omk.render_many(score)
+
+    cases = [
+        ("rebuilt unicode", lambda: " ".join([rebuilt_unicode(v) for v in score])),
+        ("Note.unicode", lambda: " ".join([v.note.unicode for v in score])),
+        ("render_many unicode", lambda: omk.render_many(score)),
+        ("Note.ly_abs8ve", lambda: " ".join([v.note.ly_abs8ve for v in score])),
+        ("render_many ly_abs8ve", lambda: omk.render_many(score, "ly_abs8ve")),
+        ("render_many ly_rel8ve", lambda: omk.render_many(score, "ly_rel8ve")),
+    ]
+
+    rows = []
+    for name, func in cases:
+        t = best_time(func)
+        rows.append([name, "{:.3f} s".format(t), "{:.0f} ns".format(t / args.notes * 1e9)])
+
+    report(rows, ["renderer", "total", "per note"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Ordering chords by pitch: sorting, argsort and range checks.
+
+Compares sorted() over TonalVectors (which converts on every comparison) and
+a copy of the earlier tonal_greater_of (up to four tonal_int calls) with the
+key-based tonal_sort, tonal_argsort, tonal_min and tonal_max.
+
+    python benchmarks/bench_sorting.py --chords 100000 --size 4
+"""
+
+import argparse
+import functools
+
+from common import best_time, random_score, report
+
+import omk_core as omk
+from omk_core import TonalVector
+
+
+def old_greater_of(x, y):
+    if omk.tonal_int(x) == omk.tonal_int(y):
+        if x[0] > y[0]:
+            return x
+        else:
+            return y
+    if omk.tonal_int(x) > omk.tonal_int(y):
+        return x
+    else:
+        return y
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--chords", type=int, default=100000)
+    parser.add_argument("--size", type=int, default=4)
+    args = parser.parse_args()
+
+    notes = [TonalVector(x) for x in random_score(args.chords * args.size)]
+    chords = [notes[i:i + args.size] for i in range(0, len(notes), args.size)]
+
+    cases = [
+        ("sorted() per chord", lambda: [sorted(c) for c in chords]),
+        ("tonal_sort per chord", lambda: [omk.tonal_sort(c) for c in chords]),
+        ("tonal_argsort per chord", lambda: [omk.tonal_argsort(c) for c in chords]),
+        ("reduce(old greater_of)", lambda: [functools.reduce(old_greater_of, c) for c in chords]),
+        ("reduce(tonal_greater_of)", lambda: [functools.reduce(omk.tonal_greater_of, c) for c in chords]),
+        ("tonal_max per chord", lambda: [omk.tonal_max(c) for c in chords]),
+        ("sorted() whole score", lambda: sorted(notes)),
+        ("tonal_sort whole score", lambda: omk.tonal_sort(notes)),
+    ]
+
+    rows = []
+    for name, func in cases:
+        t = best_time(func)
+        rows.append([name, "{:.3f} s".format(t), "{:.0f} ns".format(t / args.chords * 1e9)])
+
+    print("{} chords of {} notes".format(args.chords, args.size))
+    report(rows, ["operation", "total", "per chord"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Streaming a Lilypond-style relative melody dump through Pitches().
+
+Compares it with calling Pitch() once per token and threading
+the octave context by hand, and reports peak memory for both.
+
+    python benchmarks/bench_streaming.py --tokens 1000000
+"""
+
+import argparse
+import io
+import random
+
+from common import best_time, peak_memory, report
+
+import omk_core as omk
+
+
+def melody_dump(n, seed=0):
+    rng = random.Random(seed)
+    names = ["c", "d", "e", "f", "g", "a", "b", "fis", "bes", "cis", "ees"]
+    marks = [""] * 8 + ["'", ","]
+    lines, line = [], []
+    for _ in range(n):
+        line.append(rng.choice(names) + rng.choice(marks))
+        if len(line) == 16:
+            lines.append(" ".join(line))
+            line = []
+    lines.append(" ".join(line))
+    return "\n".join(lines)
+
+
+def by_hand(text, context):
+    result = []
+    for token in text.split():
+        context = omk.Pitch(token, context)
+        result.append(context)
+    return result
+
+
+def streamed(text, context):
+    count = 0
+    for _ in omk.Pitches(io.StringIO(text), context):
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--tokens", type=int, default=1000000)
+    args = parser.parse_args()
+
+    text = melody_dump(args.tokens)
+    start = (0, 0, 0)
+
+    rows = []
+    for name, func in (("Pitch() by hand", by_hand), ("Pitches()", streamed)):
+        _, peak = peak_memory(lambda: func(text, start))
+        t = best_time(lambda: func(text, start), repeat=1)
+        rows.append([name, "{:.3f} s".format(t), "{:.0f} ns".format(t / args.tokens * 1e9),
+                     "{:.1f} MiB".format(peak / 2**20)])
+
+    print("{} tokens, {:.1f} MB of text".format(args.tokens, len(text) / 1e6))
+    report(rows, ["reader", "total", "per token", "peak memory"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Every public tonal_arithmetic function, over the whole (d, c, o) domain.
+
+Each function runs on every value (or every pair of values) with a diatonic
+value 0-6, a chromatic value 0-11 and, for the octave domain, an octave in the
+chosen range. Before anything is timed, the table-driven functions are checked
+against the general implementations behind them, and TonalArray (when numpy is
+installed) against the pure-Python results. Timings can be saved as a JSON
+baseline; a run compared against a baseline exits with status 1 if any
+function got slower by more than the threshold.
+
+    python benchmarks/bench_suite.py --octaves -1 1 --save baseline.json
+    python benchmarks/bench_suite.py --octaves -1 1 --compare baseline.json --threshold 0.25
+"""
+
+import argparse
+import json
+import platform
+import sys
+
+from common import best_time, report, reference_diff, reference_invert
+
+from omk_core.definitions.constants import D_LEN, C_LEN
+from omk_core.tonal_algebra import tonal_arithmetic as ta
+
+try:
+    from omk_core.tonal_algebra import tonal_array
+except ImportError:
+    tonal_array = None
+
+
+MIN_CALLS = 100000
+
+UNARY = [ta.tonal_int, ta.tonal_abs, ta.tonal_abs_val, ta.tonal_key]
+
+BINARY = [
+    ta.tonal_sum, ta.tonal_diff, ta.tonal_invert, ta.tonal_abs_diff, ta.abs_int_diff,
+    ta.tonal_nearest_instance, ta.tonal_greater_of, ta.tonal_lesser_of,
+]
+
+# name : function of the whole domain
+BATCH = {
+    'tonal_ints': ta.tonal_ints,
+    'tonal_sort': ta.tonal_sort,
+    'tonal_resolve_octaves': lambda xs: ta.tonal_resolve_octaves(xs[0], xs),
+}
+OCTAVE_BATCH = {
+    'midi_numbers': ta.midi_numbers,
+    'tonal_from_midi': lambda xs: ta.tonal_from_midi(range(24, 108)),
+}
+
+# table-driven function : general implementation it must agree with
+REFERENCES = {
+    'tonal_sum': ta._tonal_sum,
+    'tonal_diff': reference_diff,
+    'tonal_invert': reference_invert,
+    'tonal_int': ta._tonal_int,
+}
+
+
+def full_domain(octaves=None):
+    """Every (d, c) pair, or every (d, c, o) triple for o in octaves."""
+    pairs = [(d, c) for d in range(D_LEN) for c in range(C_LEN)]
+    if octaves is None:
+        return pairs
+    return [(d, c, o) for o in octaves for d, c in pairs]
+
+
+def cross_check(domain, pairs):
+    """Raises AssertionError if any backend disagrees with the pure-Python results."""
+    for func in UNARY + BINARY:
+        reference = REFERENCES.get(func.__name__)
+        if reference is None:
+            continue
+        if func in UNARY:
+            assert [func(x) for x in domain] == [reference(x) for x in domain], func.__name__
+        else:
+            assert [func(x, y) for x, y in pairs] == [reference(x, y) for x, y in pairs], func.__name__
+
+    if tonal_array is None:
+        return
+    xs = tonal_array.TonalArray.from_vectors([x for x, _ in pairs])
+    ys = tonal_array.TonalArray.from_vectors([y for _, y in pairs])
+    for name in ('tonal_sum', 'tonal_diff', 'tonal_invert', 'tonal_abs_diff'):
+        expected = [getattr(ta, name)(x, y) for x, y in pairs]
+        assert getattr(tonal_array, name)(xs, ys).tolist() == expected, name + " [TonalArray]"
+    assert tonal_array.tonal_int(xs).tolist() == ta.tonal_ints(x for x, _ in pairs), "tonal_int [TonalArray]"
+
+
+def array_cases(pairs):
+    """name : (function, calls) for the TonalArray backend."""
+    if tonal_array is None:
+        return {}
+    xs = tonal_array.TonalArray.from_vectors([x for x, _ in pairs])
+    ys = tonal_array.TonalArray.from_vectors([y for _, y in pairs])
+    cases = {
+        name + " [TonalArray]": (lambda f=getattr(tonal_array, name): f(xs, ys), len(pairs))
+        for name in ('tonal_sum', 'tonal_diff', 'tonal_invert', 'tonal_abs_diff')
+    }
+    cases["tonal_int [TonalArray]"] = (lambda: tonal_array.tonal_int(xs), len(pairs))
+    return cases
+
+
+def run(octaves, repeat):
+    """Returns {'<function>/<domain>': ns per call} after cross-checking every backend."""
+    results = {}
+    for label, domain in (("octaveless", full_domain()), ("octaves", full_domain(octaves))):
+        pairs = [(x, y) for x in domain for y in domain]
+        cross_check(domain, pairs)
+
+        cases = {}
+        for func in UNARY:
+            cases[func.__name__] = (lambda f=func: [f(x) for x in domain], len(domain))
+        for func in BINARY:
+            cases[func.__name__] = (lambda f=func: [f(x, y) for x, y in pairs], len(pairs))
+        batch = dict(BATCH, **OCTAVE_BATCH) if label == "octaves" else BATCH
+        for name, func in batch.items():
+            cases[name] = (lambda f=func: f(domain), len(domain))
+        cases.update(array_cases(pairs))
+
+        for name, (func, calls) in cases.items():
+            # Small domains are run several times, so each timing covers enough calls to be stable.
+            number = max(1, MIN_CALLS // calls)
+            t = best_time(func, number=number, repeat=repeat)
+            results["{}/{}".format(name, label)] = t / (calls * number) * 1e9
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--octaves", type=int, nargs=2, default=[-1, 1], metavar=("LOW", "HIGH"),
+                        help="the octave range of the domain, inclusive")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", metavar="PATH", help="write the timings to a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the timings with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="the slowdown (0.25 = 25%%) past which a function counts as a regression")
+    args = parser.parse_args()
+
+    low, high = args.octaves
+    results = run(range(low, high + 1), args.repeat)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            saved = json.load(f)
+        if saved["octaves"] != args.octaves:
+            print("warning: the baseline was run over octaves {}".format(saved["octaves"]))
+        baseline = saved["ns_per_call"]
+
+    rows = []
+    regressions = []
+    for name, ns in results.items():
+        row = [name, "{:.0f} ns".format(ns)]
+        if name in baseline:
+            change = ns / baseline[name] - 1
+            row += ["{:.0f} ns".format(baseline[name]), "{:+.0%}".format(change)]
+            if change > args.threshold:
+                regressions.append(name)
+                row.append("REGRESSION")
+        rows.append(row)
+
+    headers = ["function/domain", "per call"]
+    if baseline:
+        headers += ["baseline", "change", ""]
+        rows = [row + [""] * (len(headers) - len(row)) for row in rows]
+    print("octaves {} to {}, all backends agree".format(low, high))
+    report(rows, headers)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "octaves": args.octaves,
+                "ns_per_call": results,
+            }, f, indent=2, sort_keys=True)
+
+    if regressions:
+        print("{} regression(s) beyond {:.0%}: {}".format(len(regressions), args.threshold, ", ".join(regressions)))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
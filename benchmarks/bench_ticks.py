@@ -0,0 +1,90 @@
+"""
+Totals, offsets and measures of a long part, with NoteLengths and with TickLengths.
+
+The NoteLength rows add Fractions note by note, the way a part is summed
+today. The TickLengths rows do the same with integer ticks, and the
+conversion row is the one-off cost of building the TickLengths. The
+note_offsets rows include that conversion, and the array row needs NumPy.
+
+    python benchmarks/bench_ticks.py --notes 100000
+"""
+
+import argparse
+import itertools
+import random
+
+from common import best_time, report
+
+from omk_core import NoteLength, TickLengths, note_offsets
+
+
+def note_length_measures(part, bar):
+    """Fills measures of length bar with NoteLength arithmetic, splitting notes at the barlines."""
+    measures, measure, room = [], [], bar
+    for i, x in enumerate(part):
+        while x >= room:
+            measure.append((i, room))
+            measures.append(measure)
+            x -= room
+            measure, room = [], bar
+        if x:
+            measure.append((i, x))
+            room -= x
+    if measure:
+        measures.append(measure)
+    return measures
+
+
+def fraction_offsets_and_total(part):
+    """Offsets and total by adding NoteLengths, the way onsets are found today."""
+    offsets = []
+    position = NoteLength(0)
+    for x in part:
+        offsets.append(position)
+        position = position + x
+    return offsets, position
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=100000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    vocabulary = ([NoteLength(1, 2**n) for n in range(5)] + [NoteLength(1, 2**n).dot() for n in range(1, 5)]
+                  + [NoteLength.TupletMember(NoteLength(1, 8), 3)])
+    part = [rng.choice(vocabulary) for _ in range(args.notes)]
+    ticks = TickLengths.from_note_lengths(part)
+    bar = NoteLength(3, 4)
+
+    assert ticks.note_length(ticks.total()) == sum(part)
+    assert len(ticks.measures(bar)) == len(note_length_measures(part, bar))
+
+    cases = [
+        ("total", lambda: sum(part), ticks.total),
+        ("offsets", lambda: list(itertools.accumulate([NoteLength(0)] + part[:-1])), ticks.offsets),
+        ("measures (3/4)", lambda: note_length_measures(part, bar), lambda: ticks.measures(bar)),
+        ("note_offsets", lambda: fraction_offsets_and_total(part), lambda: note_offsets(part)),
+    ]
+    try:
+        import numpy
+    except ImportError:
+        print("numpy is not installed; skipping the array row")
+    else:
+        cases.append(("note_offsets, array", lambda: fraction_offsets_and_total(part),
+                      lambda: note_offsets(part, array=True)))
+
+    rows = [["from_note_lengths", "", "{:.0f} ns".format(
+        best_time(lambda: TickLengths.from_note_lengths(part)) / args.notes * 1e9), ""]]
+    for name, fracs, integers in cases:
+        t_fracs = best_time(fracs)
+        t_ticks = best_time(integers)
+        rows.append([name, "{:.0f} ns".format(t_fracs / args.notes * 1e9),
+                     "{:.0f} ns".format(t_ticks / args.notes * 1e9), "{:.1f}x".format(t_fracs / t_ticks)])
+
+    print("{} notes, ppq={}".format(args.notes, ticks.ppq))
+    report(rows, ["operation", "NoteLength", "TickLengths", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Table-driven tonal_sum, tonal_diff and tonal_invert against the general implementation.
+
+Every pair of values in the domain is run through both,
+so the results are also checked for equality.
+
+    python benchmarks/bench_tonal_arithmetic.py
+"""
+
+import argparse
+
+from common import best_time, report, tonal_domain, reference_diff, reference_invert
+
+from omk_core.tonal_algebra import tonal_arithmetic as ta
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = []
+    for label, octaves in (("octaveless", None), ("with octaves", range(-1, 2))):
+        domain = tonal_domain(octaves)
+        pairs = [(x, y) for x in domain for y in domain]
+
+        for name, fast, reference in (
+            ("tonal_sum", ta.tonal_sum, ta._tonal_sum),
+            ("tonal_diff", ta.tonal_diff, reference_diff),
+            ("tonal_invert", ta.tonal_invert, reference_invert),
+        ):
+            assert [fast(x, y) for x, y in pairs] == [reference(x, y) for x, y in pairs]
+
+            t_ref = best_time(lambda: [reference(x, y) for x, y in pairs], repeat=args.repeat)
+            t_fast = best_time(lambda: [fast(x, y) for x, y in pairs], repeat=args.repeat)
+            rows.append([
+                name,
+                label,
+                len(pairs),
+                "{:.0f} ns".format(t_ref / len(pairs) * 1e9),
+                "{:.0f} ns".format(t_fast / len(pairs) * 1e9),
+                "{:.1f}x".format(t_ref / t_fast),
+            ])
+
+    report(rows, ["function", "domain", "calls", "reference", "table", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
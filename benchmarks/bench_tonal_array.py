@@ -0,0 +1,44 @@
+"""
+TonalArray against a Python loop of TonalVector operations over a whole corpus.
+
+    python benchmarks/bench_tonal_array.py --notes 1000000
+"""
+
+import argparse
+
+from common import best_time, random_score, report
+
+from omk_core import TonalArray, TonalVector
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=1000000)
+    args = parser.parse_args()
+
+    score = random_score(args.notes)
+    vectors = [TonalVector(x) for x in score]
+    array = TonalArray.from_vectors(score)
+    step = TonalVector((4, 7))
+    origin = TonalVector((0, 0, 0))
+
+    cases = [
+        ("transpose", lambda: [v + step for v in vectors], lambda: array + step),
+        ("invert", lambda: [v.inversion(origin) for v in vectors], lambda: array.inversion(origin)),
+        ("tonal_int", lambda: [int(v) for v in vectors], lambda: array.ints()),
+        ("distance", lambda: [v.distance(origin) for v in vectors], lambda: array.distance(origin)),
+    ]
+
+    rows = []
+    for name, loop, vectorized in cases:
+        t_loop = best_time(loop, repeat=1)
+        t_array = best_time(vectorized)
+        rows.append([name, "{:.3f} s".format(t_loop), "{:.4f} s".format(t_array),
+                     "{:.0f}x".format(t_loop / t_array)])
+
+    print("{} notes".format(args.notes))
+    report(rows, ["operation", "TonalVector loop", "TonalArray", "speedup"])
+
+
+if __name__ == "__main__":
+    main()
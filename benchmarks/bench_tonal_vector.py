@@ -0,0 +1,69 @@
+"""
+Memory and latency of TonalVector over a large score.
+
+Compares the current TonalVector with EagerTonalVector,
+a copy of the earlier class which carried an instance __dict__
+and built its .note and .interval helpers in __init__.
+
+    python benchmarks/bench_tonal_vector.py --notes 1000000
+"""
+
+import argparse
+
+from common import best_time, peak_memory, random_score, report
+
+from omk_core import TonalVector
+from omk_core.definitions.constants import MS
+from omk_core.tonal_algebra import tonal_arithmetic as ta
+
+
+class EagerTonalVector(tuple):
+    def __new__(cls, tp):
+        tp = ta._tonal_modulo(tp)
+        return super(EagerTonalVector, cls).__new__(EagerTonalVector, tp)
+
+    def __init__(self, tp):
+        self.d = self[0]
+        self.c = self[1]
+        self._Q = MS[self.d]
+        try:
+            self.o = self[2]
+            self._has_octave = True
+        except IndexError:
+            self.o = None
+            self._has_octave = False
+        self.note = TonalVector.Note(self)
+        self.interval = TonalVector.Interval(self)
+
+    def __add__(self, x):
+        return EagerTonalVector(ta.tonal_sum(self, x))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=1000000)
+    args = parser.parse_args()
+
+    score = random_score(args.notes)
+    step = (1, 2)
+    rows = []
+
+    for cls in (EagerTonalVector, TonalVector):
+        build = lambda: [cls(x) for x in score]
+        vectors, peak = peak_memory(build)
+        build_time = best_time(build)
+        add_time = best_time(lambda: [v + step for v in vectors])
+        rows.append([
+            cls.__name__,
+            "{:.1f} MiB".format(peak / 2**20),
+            "{:.3f} s".format(build_time),
+            "{:.3f} s".format(add_time),
+        ])
+        del vectors
+
+    print("{} vectors".format(args.notes))
+    report(rows, ["class", "peak memory", "construct", "transpose (+)"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Transposing a large part into all twelve keys.
+
+Compares `[v + interval for v in part]` over TonalVectors with streaming
+the same part through tonal_transpose, and reports peak memory for each.
+
+    python benchmarks/bench_transpose.py --notes 1000000
+"""
+
+import argparse
+import collections
+
+from common import best_time, peak_memory, random_score, report
+
+import omk_core as omk
+from omk_core import TonalVector
+
+
+KEYS = [(0, 0), (1, 1), (1, 2), (2, 3), (2, 4), (3, 5), (3, 6), (4, 7), (5, 8), (5, 9), (6, 10), (6, 11)]
+
+
+def with_vectors(part):
+    for y in KEYS:
+        interval = TonalVector(y)
+        transposed = [v + interval for v in part]
+    return len(transposed)
+
+
+def streamed(part):
+    # Consume each stream without keeping it, as when writing to a file.
+    for y in KEYS:
+        collections.deque(omk.tonal_transpose(part, y), maxlen=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--notes", type=int, default=1000000)
+    args = parser.parse_args()
+
+    score = random_score(args.notes)
+    vectors = [TonalVector(x) for x in score]
+    assert [tuple(v + (2, 3)) for v in vectors[:1000]] == list(omk.tonal_transpose(score[:1000], (2, 3)))
+
+    rows = []
+    for name, func, part in (
+        ("v + interval (TonalVector)", with_vectors, vectors),
+        ("tonal_transpose (tuples)", streamed, score),
+        ("tonal_transpose (TonalVector)", streamed, vectors),
+    ):
+        _, peak = peak_memory(lambda: func(part))
+        t = best_time(lambda: func(part), repeat=1)
+        notes = args.notes * len(KEYS)
+        rows.append([name, "{:.3f} s".format(t), "{:.0f} ns".format(t / notes * 1e9),
+                     "{:.1f} MiB".format(peak / 2**20)])
+
+    print("{} notes into {} keys".format(args.notes, len(KEYS)))
+    report(rows, ["transposition", "total", "per note", "peak memory"])
+
+
+if __name__ == "__main__":
+    main()
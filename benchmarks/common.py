@@ -0,0 +1,131 @@
+"""
+Small helpers shared by the benchmark scripts in this directory.
+
+The scripts are plain Python, run from the repository root::
+
+    python benchmarks/bench_tonal_vector.py
+
+The reference_* functions are the implementations that table-driven
+or closed-form versions replaced. The benchmarks time against them,
+and the tests in tests/ check the current versions agree with them.
+"""
+
+from fractions import Fraction as Frac
+import itertools
+import math
+import random
+import timeit
+import tracemalloc
+
+from omk_core import NoteLength
+from omk_core.definitions.constants import MS
+from omk_core.tonal_algebra import tonal_arithmetic as ta
+from omk_core.utils.math import pow2_floor_frac, is_pow2
+
+
+def tonal_domain(octaves=None):
+    """Returns every normalized tonal tuple with a modifier of at most a double sharp/flat.
+    If octaves is given (an iterable of ints), the tuples are octave-qualified.
+    """
+    chromae = [(s.d, (s.c + m) % 12) for m in (0, 1, 2, -1, -2) for s in MS]
+    if octaves is None:
+        return chromae
+    return [(d, c, o) for o in octaves for d, c in chromae]
+
+
+def random_score(n, octaves=range(-3, 4), seed=0):
+    """Returns a reproducible list of n octave-qualified tonal tuples."""
+    rng = random.Random(seed)
+    domain = tonal_domain(octaves)
+    return [rng.choice(domain) for _ in range(n)]
+
+
+def best_time(func, number=1, repeat=3):
+    """Returns the best wall time, in seconds, of `number` calls to func."""
+    return min(timeit.repeat(func, number=number, repeat=repeat))
+
+
+def peak_memory(func):
+    """Returns (result, peak bytes allocated) for a single call to func."""
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def report(rows, headers):
+    """Prints rows as a plain text table."""
+    rows = [[str(x) for x in row] for row in rows]
+    widths = [max(len(x) for x in col) for col in zip(headers, *rows)]
+    for row in itertools.chain([headers], rows):
+        print("  ".join(x.ljust(w) for x, w in zip(row, widths)))
+
+
+### Reference implementations ###
+
+def reference_diff(x, y):
+    return ta._tonal_sum(x, ta._negative_tuple(y))
+
+
+def reference_invert(x, y):
+    return reference_diff(y, reference_diff(x, y))
+
+
+def reference_nearest_instance(x, y):
+    """Picks the closest of three candidate octaves by their distance in half steps."""
+    if len(x) == 2:
+        return (y[0], y[1])
+    candidates = [(y[0], y[1], z) for z in [x[2], x[2]-1, x[2]+1]]
+    diff_candidates = {ta.abs_int_diff(x, z): z for z in candidates}
+    return diff_candidates[min(diff_candidates.keys())]
+
+
+def reference_dot(x, dots):
+    return sum([x*NoteLength(1, 2**n) for n in range(0, dots+1)])
+
+
+def reference_undot(x):
+    """Returns (base note, dots), adding one dot at a time, or None if no number of dots gives x."""
+    base_note = NoteLength(pow2_floor_frac(x))
+    for dots in itertools.count():
+        dotted_value = reference_dot(base_note, dots)
+        if dotted_value == x:
+            return base_note, dots
+        if dotted_value > x:
+            return None
+
+
+def reference_untuple(x):
+    """Returns (nominal length, tuplet type), trying each tuplet type from 3 up."""
+    if reference_undot(x) is not None:
+        return (x, None)
+    for tt in itertools.count(3):
+        nominal_length = x * tt / pow2_floor_frac(tt)
+        if is_pow2(nominal_length.denominator):
+            return NoteLength(nominal_length), tt
+
+
+def reference_pow2_floor_frac(x):
+    return Frac(2**math.floor(math.log2(x)))
+
+
+def reference_is_pow2(x):
+    return math.log2(x).is_integer()
+
+
+def reference_divide_by_largest_pow2_factor(x):
+    for f in (2**n for n in itertools.count()):
+        if f > x/2:
+            break
+        if x%f == 0:
+            best_f = f
+    return int(x/best_f)
+
+
+def reference_primes(start):
+    return (x for x in itertools.count(start) if all(
+                x % y != 0 for y in range(2, int(x ** 0.5) + 1)
+            ))
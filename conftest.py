@@ -0,0 +1,9 @@
+# Modules whose doctests need optional packages are skipped when those packages are missing.
+# The unit tests in tests/ guard themselves with pytest.importorskip.
+
+collect_ignore = []
+
+try:
+    import numpy
+except ImportError:
+    collect_ignore.append("src/omk_core/tonal_algebra/tonal_array.py")
@@ -1,14 +1,44 @@
+import importlib
+import sys
+
 #from .constants import *
 from .tonal_algebra.tonal_arithmetic import *
-from .tonal_algebra.tonal_vector import TonalVector
-from .tonal_algebra.pitch import Pitch
+from .tonal_algebra.tonal_vector import TonalVector, render_many
+from .tonal_algebra.pitch import Pitch, Pitches
 from .tonal_algebra.interval import Interval
 
 from .rhythm.note_length import NoteLength
 from .rhythm.time_signature import TimeSignature
+from .rhythm.ticks import TickLengths, note_offsets
 
-from .note.note import Note
-
-from .utils.m21_utils import play 
+from .utils.m21_utils import play # music21 is imported on the first call
 
 __version__ = '0.1.0'
+
+# Names whose modules pull in third party packages (attr, numpy)
+# are imported on first access, so `import omk_core` stays fast.
+_LAZY_ATTRIBUTES = {
+    'Note': '.note.note',
+    'TonalArray': '.tonal_algebra.tonal_array',
+}
+
+def __getattr__(name):
+    try:
+        module = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+# Module __getattr__ (PEP 562) needs Python 3.7; before that, import them up front.
+if sys.version_info < (3, 7):
+    from .note.note import Note
+    try:
+        from .tonal_algebra.tonal_array import TonalArray
+    except ImportError: # numpy is optional
+        pass
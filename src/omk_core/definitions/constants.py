@@ -1,7 +1,62 @@
-from dotmap import DotMap
+from collections.abc import Mapping
+from types import MappingProxyType
 
 D_LEN = 7  # "Diatonic Length" - The number of tones in a diatonic scale.
 C_LEN = 12 # "Chromatic Length" - The number of tones in a chromatic scale.
+MIDI_C0 = 60 # The MIDI number of middle C, which is C0 in OMK.
+
+
+class _Record(Mapping):
+    """An immutable mapping whose keys are also attributes.
+
+    Subclasses name their keys in __slots__,
+    so reading an attribute is a plain slot lookup.
+
+    >>> AC[1].a
+    '#'
+
+    >>> MS[2]['in']
+    'third'
+
+    >>> AC[0] == {'v': 'natural', 'u':'♮', 'a':'', 'ly':''}
+    True
+
+    >>> MS[0].c = 1
+    Traceback (most recent call last):
+    ...
+    AttributeError: ScaleDegree is read-only
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **values):
+        for key in self.__slots__:
+            object.__setattr__(self, key, values[key])
+
+    def __setattr__(self, key, value):
+        raise AttributeError("{} is read-only".format(self.__class__.__name__))
+
+    def __getitem__(self, key):
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, dict(self))
+
+
+class ScaleDegree(_Record):
+    __slots__ = ('d', 'c', 'q', 'in', 'ln', 'sf', 'f', 'z')
+
+class Accidental(_Record):
+    __slots__ = ('v', 'u', 'a', 'ly')
+
 
 # "M_ajor Scale"
 MS = [
@@ -15,7 +70,7 @@ MS = [
     {'d':6, 'c':11, 'q':0.5, 'in': 'seventh', 'ln':"b", 'sf':['ti'],  'f': 'leading tone', 'z': 3}
 ]
 
-MS = [DotMap(x) for x in MS]
+MS = tuple(ScaleDegree(**dict(x, sf=tuple(x['sf']))) for x in MS)
 
 # Accidentals
 AC = {
@@ -31,7 +86,7 @@ AC = {
      4 : {'v': 'quaduple sharp', 'u':'𝄪𝄪', 'a':'####', 'ly':'eseseses'},
 }
 
-AC = {i:DotMap(x) for i,x in AC.items()}
+AC = MappingProxyType({i:Accidental(**x) for i,x in AC.items()})
 
 ### I think everything below this line can be removed ###
 #class Quality:
@@ -1,9 +1,11 @@
 from fractions import Fraction as Frac
-import itertools
+import functools
 import math
 import warnings
 
-from ..utils.math import pow2_floor_frac, primes, is_pow2
+from ..utils.math import pow2_floor_frac, is_pow2
+
+MAX_TUPLET = 1024 # the largest tuplet untuple() will recognize
 
 class NoteLength(Frac):
     """
@@ -103,7 +105,8 @@ class NoteLength(Frac):
         NoteLength(1, 4).dot(1)
         """
 
-        return sum([self*Frac(1,(2**n)) for n in range(0,dots+1)])
+        # self + self/2 + ... + self/2**dots
+        return self.__class__(Frac(self) * Frac(2**(dots+1) - 1, 2**dots))
 
     # rendering to other systems, making sense
 
@@ -124,13 +127,16 @@ class NoteLength(Frac):
 
         >>> NoteLength(1,8).undot()
         (NoteLength(1, 8), 0)
+
+        >>> NoteLength(5,16).undot()
+        Traceback (most recent call last):
+        ...
+        ValueError: NoteLength(5, 16) is not a dotted note length.
         """
-        base_note = NoteLength(pow2_floor_frac(self))
-        dotted_value = base_note
-        dots = 0
-        while dotted_value != self:
-            dots += 1
-            dotted_value = base_note.dot(dots)
+        undotted = _undot(self.numerator, self.denominator)
+        if undotted is None:
+            raise ValueError("{} is not a dotted note length.".format(self._plain_repr()))
+        base_note, dots = undotted
         return self.__class__(base_note), dots
 
     def _can_undot(self):
@@ -141,15 +147,19 @@ class NoteLength(Frac):
         >>> NoteLength(7,16)._can_undot()
         True
         """
-        base_note = self.__class__(pow2_floor_frac(self))
-        for d in itertools.count():     # pragma: no branch # loop will not exit
-            if base_note.dot(d) == self:
-                return True
-            if base_note.dot(d) > self:
-                return False
+        return _undot(self.numerator, self.denominator) is not None
 
     def untuple(self):
         """
+        Returns a tuple of (nominal length, tuplet type),
+        or (self, None) if the length is a plain or dotted note length.
+
+        The tuplet type is the odd part of the denominator,
+        or 3 for a power-of-two denominator that isn't a dotted length.
+
+        Examples
+        --------
+
         >>> NoteLength(1, 3).untuple()
         (NoteLength(1, 2), 3)
 
@@ -161,15 +171,20 @@ class NoteLength(Frac):
 
         >>> NoteLength(1, 4).untuple()
         (NoteLength(1, 4), None)
+
+        >>> NoteLength(1, 2049).untuple()
+        Traceback (most recent call last):
+        ...
+        ValueError: NoteLength(1, 2049) is a 2049-tuplet member; the largest tuplet is 1024.
         """
         if self._can_undot():
             return (self, None)
 
-        for tt in itertools.count(3): # pragma: no branch # loop will not exit
-            total_length = self * tt
-            nominal_length = total_length / pow2_floor_frac(tt)
-            if is_pow2(nominal_length.denominator):
-                return self.__class__(nominal_length), tt
+        tt, ratio = _tuplet(self.denominator)
+        if tt > MAX_TUPLET:
+            raise ValueError("{} is a {}-tuplet member; the largest tuplet is {}.".format(
+                self._plain_repr(), tt, MAX_TUPLET))
+        return self.__class__(Frac(self) * ratio), tt
 
     # util methods
 
@@ -197,18 +212,42 @@ class NoteLength(Frac):
 
         >>> NoteLength.TupletMember(NoteLength(1, 4).dot(2), 3)
         NoteLength.TupletMember(NoteLength(1, 4).dot(2), 3)
+
+        >>> NoteLength(5, 12)
+        NoteLength.TupletMember(NoteLength.TupletMember(NoteLength(1, 2).dot(3), 3), 3)
+
+        Lengths whose nested tuplets would never end are written plainly.
+
+        >>> NoteLength(9, 16)
+        NoteLength(9, 16)
         """
 
+        # A run of j nested triplets can only end on a numerator of at least 2*3**(j-1) bits,
+        # so this many levels is enough for any nesting that ends.
+        depth = self.numerator.bit_length() + self.denominator.bit_length() + 4
+        return self._nested_repr(depth) or self._plain_repr()
+
+    def _nested_repr(self, depth):
+        """Returns the repr as nested tuplets and dots,
+        or None if that takes more than depth tuplets, or a tuplet beyond MAX_TUPLET.
+
+        >>> NoteLength(9, 16)._nested_repr(10) is None
+        True
+        """
         if is_pow2(self): 
             return self._plain_repr()
-        
-        untup_base, untup_tt = self.untuple()
+
+        try:
+            untup_base, untup_tt = self.untuple()
+        except ValueError: # beyond MAX_TUPLET
+            return None
         if untup_tt is not None: # tuplet
-            untuple_note, tuplet_divs = self.untuple()
-            return "NoteLength.TupletMember({}, {})".format(
-                untup_base.__repr__(),
-                untup_tt.__repr__()
-                )
+            if depth == 0:
+                return None
+            base_repr = untup_base._nested_repr(depth - 1)
+            if base_repr is None:
+                return None
+            return "NoteLength.TupletMember({}, {})".format(base_repr, untup_tt.__repr__())
 
         # is dotted but isn't tuplet
         undot_note, dots = self.undot()
@@ -267,4 +306,49 @@ class NoteLength(Frac):
         total_length = nl * pow2_floor_frac(tuplet_type)
         member_length = total_length/tuplet_type
         return cls(member_length)
-    
\ No newline at end of file
+
+
+def _undot(numerator, denominator):
+    """Returns (base length, dots) if numerator/denominator is a power of two
+    with some number of dots, otherwise None.
+
+    A base of 2**e with k dots is 2**e * (2**(k+1) - 1) / 2**k,
+    so the odd part of the numerator is 2**(k+1) - 1
+    and the denominator is a power of two.
+
+    >>> _undot(7, 16)
+    (Fraction(1, 4), 2)
+    """
+    if numerator <= 0:
+        raise ValueError("A note length must be positive.")
+    if denominator & (denominator - 1):
+        return None
+
+    shift = (numerator & -numerator).bit_length() - 1 # trailing zero bits
+    odd = numerator >> shift
+    if odd & (odd + 1): # odd + 1 is not a power of two
+        return None
+
+    dots = (odd + 1).bit_length() - 2
+    return Frac(1 << (shift + dots), denominator), dots
+
+
+@functools.lru_cache(maxsize=1024)
+def _tuplet(denominator):
+    """Returns (tuplet type, nominal length / member length) for members
+    of a tuplet with the given denominator.
+
+    A tuplet of tt divides pow2_floor(tt) nominal lengths into tt members,
+    so its members' denominators carry the odd part of tt.
+    The smallest such tt (from 3 up) is the odd part of the denominator;
+    any tt will do for a power of two, so that is 3.
+
+    >>> _tuplet(12)
+    (3, Fraction(3, 2))
+
+    >>> _tuplet(20)
+    (5, Fraction(5, 4))
+    """
+    odd = denominator >> ((denominator & -denominator).bit_length() - 1)
+    tt = odd if odd > 1 else 3
+    return tt, Frac(tt, 1 << (tt.bit_length() - 1))
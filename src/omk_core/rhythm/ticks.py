@@ -0,0 +1,212 @@
+"""
+Add up, place and bar a whole sequence of note lengths --- in integer ticks.
+
+A TickLengths holds many note lengths as integer tick counts
+at a common resolution, `ppq` (ticks per quarter note),
+so totals, offsets and measures need no Fraction arithmetic.
+Conversion to and from NoteLength is lossless.
+"""
+
+from fractions import Fraction as Frac
+import functools
+import itertools
+import math
+
+from .note_length import NoteLength
+
+
+class TickLengths():
+    """A sequence of note lengths, as integer ticks at `ppq` ticks per quarter note.
+
+    Examples
+    --------
+
+    >>> part = TickLengths.from_note_lengths([NoteLength(1, 4), NoteLength(1, 8).dot(), NoteLength(1, 16)])
+    >>> part
+    TickLengths([4, 3, 1], ppq=4)
+
+    >>> part.total(), part.offsets()
+    (8, [0, 4, 7])
+
+    >>> part.to_note_lengths()
+    [NoteLength(1, 4), NoteLength(1, 8).dot(1), NoteLength(1, 16)]
+    """
+
+    __slots__ = ('ticks', 'ppq')
+
+    def __init__(self, ticks, ppq):
+        self.ticks = list(ticks)
+        self.ppq = ppq
+
+    ### Conversion ###
+
+    @classmethod
+    def from_note_lengths(cls, note_lengths, ppq=None):
+        """Returns a TickLengths from an iterable of NoteLengths (or anything castable to Fraction).
+
+        By default, ppq is the smallest resolution at which every length is a whole number of ticks.
+        A ppq that can't represent every length exactly raises ValueError.
+
+        >>> TickLengths.from_note_lengths([NoteLength(1, 4), NoteLength.TupletMember(NoteLength(1, 8), 3)])
+        TickLengths([3, 1], ppq=3)
+
+        >>> TickLengths.from_note_lengths(['1/4', '1/8'], ppq=480)
+        TickLengths([480, 240], ppq=480)
+
+        >>> TickLengths.from_note_lengths(['1/7'], ppq=480)
+        Traceback (most recent call last):
+        ...
+        ValueError: 1/7 is not a whole number of ticks at 480 ticks per quarter note.
+        """
+        fracs = [x if isinstance(x, Frac) else Frac(x) for x in note_lengths]
+        denominators = {x.denominator for x in fracs}
+        if ppq is None:
+            ppq = _lcm(4, *denominators) // 4
+
+        # ticks per 1/d note, for each denominator d
+        whole = 4 * ppq
+        scale = {d: whole // d for d in denominators}
+        if any(whole % d for d in denominators):
+            x = next(x for x in fracs if whole % x.denominator)
+            raise ValueError("{} is not a whole number of ticks at {} ticks per quarter note.".format(x, ppq))
+        return cls([x.numerator * scale[x.denominator] for x in fracs], ppq)
+
+    def to_note_lengths(self):
+        """Returns a list of NoteLengths.
+
+        >>> TickLengths([6, 2], ppq=4).to_note_lengths()
+        [NoteLength(1, 4).dot(1), NoteLength(1, 8)]
+        """
+        whole = 4 * self.ppq
+        return [NoteLength(t, whole) for t in self.ticks]
+
+    def note_length(self, ticks):
+        """Returns a tick count at this resolution, such as a total or offset, as a NoteLength.
+
+        >>> part = TickLengths([4, 4, 8], ppq=4)
+        >>> part.note_length(part.total())
+        NoteLength(1, 1)
+        """
+        return NoteLength(ticks, 4 * self.ppq)
+
+    ### Sequence operations ###
+
+    def total(self):
+        """Returns the summed length of the sequence, in ticks.
+
+        >>> TickLengths([3, 1, 4], ppq=2).total()
+        8
+        """
+        return sum(self.ticks)
+
+    def offsets(self):
+        """Returns the start of each note, in ticks from the start of the sequence.
+
+        >>> TickLengths([3, 1, 4], ppq=2).offsets()
+        [0, 3, 4]
+        """
+        return self.offsets_and_total()[0]
+
+    def offsets_and_total(self, array=False):
+        """Returns (offsets, total) from a single prefix sum over the ticks.
+
+        With array=True, the offsets are a NumPy int64 array
+        (NumPy is imported on the first such call).
+
+        >>> TickLengths([3, 1, 4], ppq=2).offsets_and_total()
+        ([0, 3, 4], 8)
+        """
+        if array:
+            import numpy as np
+            ticks = np.array(self.ticks, dtype=np.int64)
+            ends = np.cumsum(ticks)
+            return ends - ticks, int(ends[-1]) if len(ends) else 0
+
+        starts = list(itertools.accumulate(itertools.chain((0,), self.ticks)))
+        return starts[:-1], starts[-1]
+
+    def measures(self, time_signature):
+        """Returns the sequence filled into measures of the given length,
+        as a list of measures, each a list of (index, ticks) pairs.
+
+        `index` is the position of the note in the sequence.
+        A note that crosses a barline is split, and its index appears in
+        each measure it sounds in. The last measure may be incomplete.
+
+        >>> part = TickLengths.from_note_lengths(['1/2', '3/4', '1/4', '1/2'])
+        >>> part.measures('3/4')
+        [[(0, 2), (1, 1)], [(1, 2), (2, 1)], [(3, 2)]]
+
+        >>> part.measures('5/8')
+        Traceback (most recent call last):
+        ...
+        ValueError: 5/8 is not a whole number of ticks at 1 ticks per quarter note.
+        """
+        bar, r = divmod(Frac(time_signature).numerator * 4 * self.ppq, Frac(time_signature).denominator)
+        if r:
+            raise ValueError("{} is not a whole number of ticks at {} ticks per quarter note.".format(
+                Frac(time_signature), self.ppq))
+
+        measures = []
+        measure = []
+        room = bar
+        for i, t in enumerate(self.ticks):
+            while t >= room:
+                measure.append((i, room))
+                measures.append(measure)
+                t -= room
+                measure = []
+                room = bar
+            if t:
+                measure.append((i, t))
+                room -= t
+        if measure:
+            measures.append(measure)
+        return measures
+
+    ### Sequence protocol ###
+
+    def __len__(self):
+        return len(self.ticks)
+
+    def __iter__(self):
+        return iter(self.ticks)
+
+    def __eq__(self, other):
+        """Two TickLengths are equal if they hold the same note lengths, whatever their ppq.
+
+        >>> TickLengths([1, 2], ppq=2) == TickLengths([2, 4], ppq=4)
+        True
+        """
+        if not isinstance(other, TickLengths):
+            return NotImplemented
+        return (len(self) == len(other)
+                and all(a * other.ppq == b * self.ppq for a, b in zip(self.ticks, other.ticks)))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "TickLengths({!r}, ppq={!r})".format(self.ticks, self.ppq)
+
+
+def note_offsets(note_lengths, ppq=None, array=False):
+    """Returns (offsets, total, ppq) for a sequence of NoteLengths, in one pass.
+
+    The lengths are rescaled to a common resolution once (see TickLengths.from_note_lengths),
+    and the offsets of the notes and the total length come from a prefix sum of integer ticks,
+    at ppq ticks per quarter note. With array=True, the offsets are a NumPy int64 array.
+
+    >>> offsets, total, ppq = note_offsets([NoteLength(1, 4), NoteLength(1, 8).dot(), NoteLength(1, 16)])
+    >>> offsets, total, ppq
+    ([0, 4, 7], 8, 4)
+
+    >>> NoteLength(total, 4 * ppq)
+    NoteLength(1, 2)
+    """
+    ticks = TickLengths.from_note_lengths(note_lengths, ppq)
+    offsets, total = ticks.offsets_and_total(array)
+    return offsets, total, ticks.ppq
+
+
+def _lcm(*ns):
+    return functools.reduce(lambda a, b: a * b // math.gcd(a, b), ns, 1)
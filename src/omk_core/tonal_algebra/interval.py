@@ -1,6 +1,7 @@
 import re
 
 from ..definitions.constants import MS
+from ..utils.py_utils import ResizableLRUCache
 from . import tonal_vector as tv
 from . import interval_quality as iq
 
@@ -42,6 +43,16 @@ def Interval(istr):
     return tv.TonalVector(interval_to_tuple(istr))
 
 def interval_to_tuple(istr):
+    """Returns a tonal primitive (a tuple) from a human readable interval string.
+    Results are cached in interval_cache.
+
+    >>> interval_to_tuple('P5')
+    (4, 7)
+    """
+    return interval_cache.cached(istr)
+
+def _interval_to_tuple(istr):
+    """The uncached implementation of interval_to_tuple."""
 
     i_re = _interval_parser.fullmatch(istr)
 
@@ -55,7 +66,7 @@ def interval_to_tuple(istr):
     # determine chromatic value from difference between "natural" quality and given quality
     
     qn = i_re[1]  
-    q = iq._get_quality(qn, d)
+    q = iq._str_quality(qn, d)
     
     c = MS[d].c + q.chromatic_modifier
 
@@ -68,6 +79,12 @@ def interval_to_tuple(istr):
         return(d, c, o)
 
 
+interval_cache = ResizableLRUCache(_interval_to_tuple, maxsize=1024)
+"""The cache of interval_to_tuple results.
+Use its cache_info(), cache_clear() and cache_resize(maxsize) methods to manage it.
+"""
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
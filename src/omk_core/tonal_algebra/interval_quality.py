@@ -135,7 +135,13 @@ def _(v, _=None):
     >>> _get_quality((0,11))
     IntervalQuality("diminished-from_perfect", -1)
     """
-    d, c = v[0], v[1]
+    try:
+        return _vector_qualities[v[0], v[1]]
+    except KeyError:
+        return _get_quality(_quality_value(v[0], v[1]))
+
+def _quality_value(d, c):
+    """The relative quality number of the interval with diatonic value d and chromatic value c."""
     d_val = MS[d]
     modifier = c - d_val.c
     base_q_val = d_val.q
@@ -148,18 +154,38 @@ def _(v, _=None):
             d_val_c = d_val.c + C_LEN
         modifier = c - d_val_c
 
-
-
     if modifier < 0:
         base_q_val = -base_q_val
 
-    return _get_quality(base_q_val + modifier)
+    return base_q_val + modifier
+
+def _vector_quality(v):
+    """Returns the IntervalQuality of a tonal vector (or tuple) with a table lookup.
+    Vectors outside the table (too far from any named quality)
+    raise KeyError, as _get_quality does.
+
+    >>> _vector_quality((4,7,1))
+    IntervalQuality("perfect", 0)
+    """
+    try:
+        return _vector_qualities[v[0], v[1]]
+    except KeyError:
+        return qualities[_quality_value(v[0], v[1])]
+
+# (d, c) : IntervalQuality, for every pair that has a named quality
+_vector_qualities = {
+    (d, c): qualities[_quality_value(d, c)]
+    for d in range(D_LEN) for c in range(C_LEN)
+    if _quality_value(d, c) in qualities
+}
 
 
 
 @_get_quality.register(str)
-def _(q, d=None):
-    """
+def _str_quality(q, d=None):
+    """Returns the quality named by q, for an interval with diatonic value d.
+    Known names and abbreviations are a single lookup in _quality_aliases.
+
     >>> _get_quality("M")
     IntervalQuality("major", 0.5)
 
@@ -190,19 +216,31 @@ def _(q, d=None):
     >>> _get_quality("d", 1)
     IntervalQuality("diminished-from_maj_min", -1.5)
     """
-
+    try:
+        return _quality_aliases[q, d]
+    except KeyError:
+        pass
+    try:
+        return _quality_aliases[q.lower(), d]
+    except KeyError:
+        return _scan_quality(q, d)
+
+def _scan_quality(q, d=None):
+    """Resolves a quality string by comparing it against every quality name and abbreviation.
+    Used to build _quality_aliases, and for strings that aren't in it.
+    """
     for rel_number, quality in qualities.items():
         if quality.name.lower() == q.lower():
             return quality
 
     for rel_number, quality in qualities.items():
-        if (len(q) == 1 and q is "M") or q.lower() == "maj":
-            return _get_quality("major")
-        if (len(q) == 1 and q is "m") or q.lower() == "min":
-            return _get_quality("minor")
+        if (len(q) == 1 and q == "M") or q.lower() == "maj":
+            return _scan_quality("major")
+        if (len(q) == 1 and q == "m") or q.lower() == "min":
+            return _scan_quality("minor")
 
         if q.lower() == "p" or q.lower() == "per":
-            return _get_quality("perfect")
+            return _scan_quality("perfect")
 
         if q.lower() in ["a","d"] or any(qstr in q.lower() for qstr in ['dim', 'aug', 'dbl']):
             return _get_quality_x(q, d)
@@ -231,4 +269,40 @@ def _get_quality_x(q, d): # x= extended
     return _get_quality(q_val)
 
 
-    
+def _build_quality_aliases():
+    """Lists every known quality name and abbreviation with the diatonic values it's valid for
+    (and None, when the quality doesn't depend on it): major and minor for the degrees with
+    major and minor qualities, perfect for the perfect degrees, augmented and diminished for every degree.
+    'M' and 'm' are kept case sensitive; every other alias is stored lowercase.
+    Anything else, such as "trpl aug", is left to _scan_quality.
+    """
+    index = {}
+    for base_quality, names in ((0, ("p", "per", "perfect")),
+                                (0.5, ("M", "maj", "major")),
+                                (-0.5, ("m", "min", "minor"))):
+        for alias in names:
+            index[alias, None] = qualities[base_quality]
+            for d in range(D_LEN):
+                if MS[d].q == abs(base_quality):
+                    index[alias, d] = qualities[base_quality]
+
+    for quality in qualities.values():
+        if quality.name.lower() not in ("perfect", "major", "minor"):
+            for d in (None,) + tuple(range(D_LEN)):
+                index[quality.name.lower(), d] = quality
+
+    for q_add, names in ((1, ("a", "aug", "augmented")), (-1, ("d", "dim", "diminished"))):
+        for alias in names:
+            multiples = [(alias, q_add)]
+            if len(alias) > 1:
+                multiples += [(prefix + sep + alias, 2 * q_add)
+                              for prefix in ("dbl", "double") for sep in ("", " ", "_", "-")]
+            for d in range(D_LEN):
+                # on a major/minor degree, augmented counts up from major and diminished down from minor
+                base_quality = math.copysign(MS[d].q, q_add)
+                for x, q_val in multiples:
+                    index[x, d] = qualities[base_quality + q_val]
+    return index
+
+# (alias, d) : IntervalQuality
+_quality_aliases = _build_quality_aliases()
@@ -1,6 +1,8 @@
+import functools
 import re
 
 from ..definitions.constants import MS, AC
+from ..utils.py_utils import ResizableLRUCache
 from . import tonal_arithmetic as ta
 from . import tonal_vector as tv
 
@@ -125,6 +127,36 @@ def pitch_to_tuple(nstr, octave_context=None):
     ...
     ValueError: Pitch string representation is malformed.
 
+    >>> pitch_to_tuple('cx')
+    Traceback (most recent call last):
+    ...
+    ValueError: Pitch modifier is not recognized.
+
+    Parses which do not depend on a preceding note
+    (no octave_context, or 'c4') are cached in pitch_cache.
+
+    """
+    if octave_context is None or isinstance(octave_context, str):
+        return pitch_cache.cached(nstr, octave_context)
+    return _pitch_to_tuple(nstr, octave_context)
+
+
+def _pitch_to_tuple(nstr, octave_context=None):
+    """The uncached implementation of pitch_to_tuple."""
+    d, c, o_str = _split_pitch(nstr)
+
+    o = _octave_reader((d,c), o_str, octave_context)
+
+    if o is not None:
+        return (d, c, o)
+    return (d, c)
+
+
+def _split_pitch(nstr):
+    """Returns the diatonic value, chromatic value and unread octave string of nstr.
+
+    >>> _split_pitch("bis''")
+    (6, 10, "''")
     """
     note_re = _note_parser.fullmatch(nstr)
 
@@ -135,20 +167,88 @@ def pitch_to_tuple(nstr, octave_context=None):
     m = note_re[2].lower() or ''
     o_str = note_re[3] or ''
     
-    s = [x for x in MS if x.ln == n][0]
-    
+    s = _letter_index[n]
+
     d = s.d
-    
-    m_key = [key for key,strs in AC.items() if m in strs.values()][0]
-    
+
+    try:
+        m_key = _modifier_index[m]
+    except KeyError:
+        raise ValueError("Pitch modifier is not recognized.")
+
     c = s.c + m_key
-    
-    o = _octave_reader((d,c), o_str, octave_context)
 
-    if o is not None:
-        return (d, c, o)
-    return (d, c)
+    return (d, c, o_str)
+
+
+pitch_cache = ResizableLRUCache(_pitch_to_tuple, maxsize=4096)
+"""The cache of context-free pitch_to_tuple results.
+Use its cache_info(), cache_clear() and cache_resize(maxsize) methods to manage it.
+"""
+
+
+def Pitches(source, octave_context=None):
+    """Yields a TonalVector for each note in source, as it is read.
+
+    Parameters
+    ----------
+
+    source : str or iterable of str
+        Whitespace-separated note strings, in any form Pitch() accepts.
+        An iterable (such as an open file) is read one item at a time,
+        so the whole input is never held in memory.
+
+    octave_context : tonal object or 'c4'
+        As for Pitch(). If it is a tonal object,
+        the notes are read as a Lilypond relative sequence:
+        each note is the octave context of the next.
+
+    Examples
+    --------
+
+    >>> list(Pitches("c4 e4 g4", 'c4'))
+    [TonalVector((0, 0, 0)), TonalVector((2, 4, 0)), TonalVector((4, 7, 0))]
+
+    >>> melody = Pitches(["c d e f", "g a b c'"], Pitch("c", (0,0,0)))
+    >>> [v.note.ly_abs8ve for v in melody]
+    ['c', 'd', 'e', 'f', 'g', 'a', 'b', "c''"]
+    """
+    for tp in pitches_to_tuples(source, octave_context):
+        yield tv.TonalVector(tp)
+
+
+def pitches_to_tuples(source, octave_context=None):
+    """Yields a tonal primitive (a tuple) for each note in source, as it is read.
+    Takes the same arguments as Pitches().
+
+    >>> list(pitches_to_tuples("a b c'", (0,0,0)))
+    [(5, 9, -1), (6, 11, -1), (0, 0, 1)]
+    """
+    if isinstance(source, str):
+        source = (source,)
+
+    if octave_context is None or isinstance(octave_context, str):
+        for chunk in source:
+            for token in _token_finder.finditer(chunk):
+                yield pitch_cache.cached(token[0], octave_context)
+        return
+
+    # Relative octaves: only the note name can be cached, not the octave.
+    for chunk in source:
+        for token in _token_finder.finditer(chunk):
+            d, c, o_str = _cached_split_pitch(token[0])
+            octave_context = (d, c, _octave_reader((d, c), o_str, octave_context))
+            yield octave_context
+
+
+_cached_split_pitch = functools.lru_cache(maxsize=1024)(_split_pitch)
+
+_token_finder = re.compile(r'\S+')
+
 
+# Reverse indexes into MS and AC, so the parser does one lookup for each.
+_letter_index = {s.ln: s for s in MS} # letter name : scale degree
+_modifier_index = {spelling: halfsteps for halfsteps, ac in AC.items() for spelling in ac.values()}
 
 _note_parser = re.compile('([a-gA-G])\s*([^-\d\s\'\,]*)\s*(-?[0-9\'\,]*)')
 
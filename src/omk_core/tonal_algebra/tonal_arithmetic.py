@@ -7,9 +7,11 @@ These functions operate on tuples of the form `(d, c, o)`, where
 `o` is an optional integer reprenting an octave designation.
 """
 
+import functools
 import itertools
+import numbers
 
-from ..definitions.constants import D_LEN, C_LEN, MS
+from ..definitions.constants import D_LEN, C_LEN, MS, MIDI_C0
 from ..utils import *
 
 #@mus_utils.tonal_args
@@ -38,12 +40,118 @@ def tonal_sum(x, y):
     if len(x) < len(y):
         raise TypeError("An octave designation cannot be added to an abstract tonal value.")
 
+    try:
+        d, c, o = _SUM_TABLE[x[0], x[1], y[0], y[1]]
+    except (KeyError, IndexError, TypeError):
+        return _tonal_sum(x, y)
+
+    if len(x) == 2:
+        return (d, c)
+    if len(x) == 3:
+        if len(y) == 2:
+            return (d, c, x[2] + o)
+        return (d, c, x[2] + y[2] + o)
+    return _tonal_sum(x, y)
+
+def _tonal_sum(x, y):
+    """Returns the value of x augmented by y, for any x and y.
+
+    This is the general implementation of tonal_sum,
+    and is used to build the lookup tables.
+
+    >>> _tonal_sum((6, 11, 1), (2, 4))
+    (1, 3, 2)
+
+    >>> _tonal_sum((7, 12, 0), (-1, -1, 0))
+    (6, 11, 0)
+    """
+
     sum = tuple(xval+yval for xval,yval in itertools.zip_longest(x,y, fillvalue=0))
 
     sum = _tonal_modulo(sum)
 
     return sum
 
+def tonal_transpose(xs, y):
+    """Yields each value of xs augmented by y, as tonal_sum(x, y) would, as xs is read.
+
+    y is either one interval (a tuple, TonalVector, or other sequence of two or three ints),
+    used for every value, or an iterable of intervals, one for each value of xs.
+    Nothing is kept beyond the current value, so xs can be
+    a generator over a file of any length.
+
+    Examples
+    --------
+
+    >>> list(tonal_transpose([(0,0,0), (3,6), (6,11,1)], [2,4]))
+    [(2, 4, 0), (5, 10), (1, 3, 2)]
+
+    >>> list(tonal_transpose([(0,0,0), (0,0,0)], iter([(4,7), (2,3,1)])))
+    [(4, 7, 0), (2, 3, 1)]
+
+    >>> list(tonal_transpose([(0,0,0), (0,0,0)], [(4,7)]))
+    Traceback (most recent call last):
+    ...
+    ValueError: There are fewer intervals than values to transpose.
+    """
+    if not _is_interval(y):
+        yield from _transpose_each(xs, y)
+        return
+    if not isinstance(y, tuple):
+        y = tuple(y)
+
+    offsets = _transposition_table(y[0], y[1])
+    if offsets is None: # y isn't normalized, so it isn't in the tables
+        for x in xs:
+            yield tonal_sum(x, y)
+        return
+
+    octave = y[2] if len(y) == 3 else 0
+    for x in xs:
+        try:
+            d, c, o = offsets[x[0], x[1]]
+        except KeyError:
+            yield tonal_sum(x, y)
+            continue
+        if len(x) == 3:
+            yield (d, c, x[2] + o + octave)
+        elif len(y) == 3:
+            raise TypeError("An octave designation cannot be added to an abstract tonal value.")
+        else:
+            yield (d, c)
+
+def _is_interval(y):
+    """True if y is a single interval rather than an iterable of intervals."""
+    if isinstance(y, tuple):
+        return True
+    try:
+        n = len(y)
+    except TypeError: # an iterator
+        return False
+    return n in (2, 3) and all(isinstance(v, numbers.Integral) for v in y)
+
+def _transpose_each(xs, ys):
+    """tonal_transpose with one interval for each value;
+    raises ValueError if xs and ys are not the same length."""
+    end = object()
+    ys = iter(ys)
+    for x in xs:
+        y = next(ys, end)
+        if y is end:
+            raise ValueError("There are fewer intervals than values to transpose.")
+        yield tonal_sum(x, y)
+    if next(ys, end) is not end:
+        raise ValueError("There are more intervals than values to transpose.")
+
+@functools.lru_cache(maxsize=128)
+def _transposition_table(yd, yc):
+    """The row of _SUM_TABLE for the interval (yd, yc), keyed by (d, c),
+    or None if (yd, yc) is not a normalized interval.
+    """
+    if (0, 0, yd, yc) not in _SUM_TABLE:
+        return None
+    return {(xd, xc): _SUM_TABLE[xd, xc, yd, yc] for xd in range(D_LEN) for xc in range(C_LEN)}
+
 # @tonal_args
 def tonal_diff(x, y):
     """Returns the value of x diminished by y.
@@ -71,6 +179,20 @@ def tonal_diff(x, y):
 
     """
 
+    if len(x) < len(y):
+        raise TypeError("An octave designation cannot be added to an abstract tonal value.")
+
+    try:
+        d, c, o = _DIFF_TABLE[x[0], x[1], y[0], y[1]]
+    except (KeyError, IndexError, TypeError):
+        return tonal_sum(x, _negative_tuple(y))
+
+    if len(x) == 2:
+        return (d, c)
+    if len(x) == 3:
+        if len(y) == 2:
+            return (d, c, x[2] + o)
+        return (d, c, x[2] - y[2] + o)
     return tonal_sum(x, _negative_tuple(y))
 
 def _negative_tuple(x):
@@ -108,6 +230,15 @@ def tonal_invert(x, y=(0,0)):
 
     x, y = qualify_octave_as_needed(x, y)
 
+    try:
+        d, c, o = _INVERT_TABLE[x[0], x[1], y[0], y[1]]
+    except (KeyError, IndexError, TypeError):
+        return tonal_diff(y, tonal_diff(x, y))
+
+    if len(x) == 2:
+        return (d, c)
+    if len(x) == 3:
+        return (d, c, 2*y[2] - x[2] + o)
     return tonal_diff(y, tonal_diff(x, y))
 
 
@@ -192,6 +323,22 @@ def tonal_int(x):
 
     """
 
+    try:
+        if len(x) == 3:
+            return _INT_TABLE[x[0], x[1]] + x[2]*C_LEN
+        if len(x) == 2:
+            return _OCTAVELESS_INT_TABLE[x[0], x[1]]
+    except (KeyError, TypeError):
+        pass
+    return _tonal_int(x)
+
+def _tonal_int(x):
+    """The general implementation of tonal_int, for any x.
+
+    >>> _tonal_int((0,-1,-1))
+    -13
+    """
+
     if len(x) == 2:
         x = _tonal_unmodulo(x)
         return x[1]
@@ -211,7 +358,106 @@ def tonal_int(x):
 
     return c + x[2]*(C_LEN)
 
-        
+def tonal_ints(xs):
+    """Returns a list of tonal_int values, one for each tonal value in xs.
+
+    >>> tonal_ints([(0,0,0), (4,7,2), (6,11,-1), (0,11)])
+    [0, 31, -1, -1]
+    """
+    return [tonal_int(x) for x in xs]
+
+def midi_numbers(xs):
+    """Returns a list of MIDI note numbers, one for each octave-qualified tonal value in xs.
+    Middle C (C0) is MIDI note 60.
+
+    >>> midi_numbers([(0,0,0), (5,9,0), (6,11,-1)])
+    [60, 69, 59]
+
+    >>> midi_numbers([(0,0)])
+    Traceback (most recent call last):
+    ...
+    TypeError: A MIDI number needs an octave designation.
+    """
+    xs = list(xs) # read twice if the fast path falls through
+    try:
+        return [_INT_TABLE[x[0], x[1]] + x[2]*C_LEN + MIDI_C0 for x in xs]
+    except (KeyError, IndexError, TypeError):
+        pass
+
+    midi = []
+    for x in xs:
+        if len(x) != 3:
+            raise TypeError("A MIDI number needs an octave designation.")
+        midi.append(tonal_int(x) + MIDI_C0)
+    return midi
+
+def tonal_from_int(i, spelling='sharp'):
+    """Returns the octave-qualified tonal value i half steps from the origin (Middle C).
+
+    Parameters
+    ----------
+
+    i : int
+
+    spelling : 'sharp', 'flat' or a sequence of twelve chromae
+        How to name each pitch class.
+        'sharp' and 'flat' spell black keys as sharps or flats.
+        A sequence gives the (d, c) to use for each pitch class, starting at C.
+
+    Examples
+    --------
+
+    >>> tonal_from_int(13)
+    (0, 1, 1)
+
+    >>> tonal_from_int(13, 'flat')
+    (1, 1, 1)
+
+    >>> tonal_from_int(-1)
+    (6, 11, -1)
+    """
+    return tonal_from_ints([i], spelling)[0]
+
+def tonal_from_ints(ints, spelling='sharp'):
+    """Returns a list of octave-qualified tonal values from half step distances.
+    The spelling hint works as in tonal_from_int.
+
+    >>> tonal_from_ints([0, 6, -6], 'flat')
+    [(0, 0, 0), (4, 6, 0), (4, 6, -1)]
+
+    >>> b_sharp = [(6, 0)] + [(0, c) for c in range(1, 12)]
+    >>> tonal_from_ints([0, 12], b_sharp)
+    [(6, 0, -1), (6, 0, 0)]
+    """
+    spelled = _spelling_table(spelling)
+    values = []
+    for i in ints:
+        d, c = spelled[i % C_LEN]
+        values.append((d, c, (i - _INT_TABLE[d, c]) // C_LEN))
+    return values
+
+def tonal_from_midi(numbers, spelling='sharp'):
+    """Returns a list of octave-qualified tonal values from MIDI note numbers.
+    The spelling hint works as in tonal_from_int.
+
+    >>> tonal_from_midi([60, 70, 59], 'flat')
+    [(0, 0, 0), (6, 10, 0), (6, 11, -1)]
+    """
+    return tonal_from_ints([n - MIDI_C0 for n in numbers], spelling)
+
+_SHARP_SPELLING = ((0,0), (0,1), (1,2), (1,3), (2,4), (3,5), (3,6), (4,7), (4,8), (5,9), (5,10), (6,11))
+_FLAT_SPELLING = ((0,0), (1,1), (1,2), (2,3), (2,4), (3,5), (4,6), (4,7), (5,8), (5,9), (6,10), (6,11))
+
+def _spelling_table(spelling):
+    if spelling == 'sharp':
+        return _SHARP_SPELLING
+    if spelling == 'flat':
+        return _FLAT_SPELLING
+
+    spelled = tuple(tuple(x) for x in spelling)
+    if len(spelled) != C_LEN or any(x[1] % C_LEN != pc for pc, x in enumerate(spelled)):
+        raise ValueError("A spelling needs one chroma for each of the twelve pitch classes, in order.")
+    return tuple(_tonal_modulo(x) for x in spelled)
 
 def tonal_greater_of(x,y):
     """
@@ -221,13 +467,15 @@ def tonal_greater_of(x,y):
     >>> tonal_greater_of((0,0,0),(0,10,0))
     (0, 0, 0)
     """
-    if tonal_int(x) == tonal_int(y):
+    x_int, y_int = tonal_int(x), tonal_int(y)
+
+    if x_int == y_int:
         if x[0] > y[0]:
             return x
         else:
             return y
 
-    if tonal_int(x) > tonal_int(y):
+    if x_int > y_int:
         return x
     else:
         return y
@@ -242,17 +490,62 @@ def tonal_lesser_of(x,y):
     """
     x = _tonal_unmodulo(x)
     y = _tonal_unmodulo(y)
+    x_int, y_int = tonal_int(x), tonal_int(y)
 
-    if tonal_int(x) == tonal_int(y):
+    if x_int == y_int:
         if x[0] < y[0]:
             return x
         else:
             return y
-    if tonal_int(x) < tonal_int(y):
+    if x_int < y_int:
         return _tonal_modulo(x)
     else:
         return _tonal_modulo(y)
 
+def tonal_key(x):
+    """The sort key of a tonal value: its half step value, then its diatonic value,
+    so enharmonic equivalents are ordered by letter name, as in tonal_greater_of.
+
+    >>> tonal_key((6,0,0)) < tonal_key((0,0,1)) # B sharp sorts after C
+    False
+    """
+    return (tonal_int(x), x[0])
+
+def tonal_sort(xs, reverse=False):
+    """Returns a new list of the tonal values in xs, from lowest to highest.
+    Each value is converted to its sort key once.
+
+    >>> tonal_sort([(4,7,0), (0,0,1), (6,0,0), (6,11,-1)])
+    [(6, 11, -1), (4, 7, 0), (0, 0, 1), (6, 0, 0)]
+    """
+    return sorted(xs, key=tonal_key, reverse=reverse)
+
+def tonal_argsort(xs, reverse=False):
+    """Returns the indexes that would sort xs, as tonal_sort does.
+
+    >>> tonal_argsort([(4,7,0), (0,0,1), (6,0,0), (6,11,-1)])
+    [3, 0, 1, 2]
+    """
+    keys = [tonal_key(x) for x in xs]
+    return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+
+def tonal_min(xs):
+    """Returns the lowest tonal value in xs, in a single pass.
+
+    >>> tonal_min([(4,7,0), (0,0,1), (6,11,-1)])
+    (6, 11, -1)
+    """
+    return min(xs, key=tonal_key)
+
+def tonal_max(xs):
+    """Returns the highest tonal value in xs, in a single pass.
+    Of two enharmonic equivalents, the one with the greater diatonic value is higher.
+
+    >>> tonal_max([(4,7,0), (0,0,1), (6,0,0)])
+    (6, 0, 0)
+    """
+    return max(xs, key=tonal_key)
+
 def tonal_abs_val(x):
     """
     >>> tonal_abs_val((4,7))
@@ -341,13 +634,65 @@ def tonal_abs_diff(x,y):
 
     #return tonal_lesser_of(tonal_diff(x,y), tonal_diff(y,x))
 
-    a = tonal_abs_val(tonal_diff(x,y))
-    b = tonal_abs_val(tonal_diff(y,x))
+    return _abs_diff_of(tonal_diff(x,y))
 
+def _abs_diff_of(z):
+    """tonal_abs_diff(x, y), which depends only on z = tonal_diff(x, y)
+    (tonal_diff(y, x) being the normalized negative of z).
+    Only differences of plain ints are cached, so equal values of other types
+    (such as 0.0 and 0) don't share a result.
+    """
+    if _exact_ints(z):
+        return _cached_abs_diff_of(z)
+    return _uncached_abs_diff_of(z)
 
+def _uncached_abs_diff_of(z):
+    a = tonal_abs_val(z)
+    b = tonal_abs_val(_tonal_modulo(_negative_tuple(z)))
 
     return _tonal_modulo(tonal_lesser_of(a, b))
 
+_cached_abs_diff_of = functools.lru_cache(maxsize=4096)(_uncached_abs_diff_of)
+
+def _exact_ints(tp):
+    """True if every element of tp is exactly an int (not a float, bool or NumPy integer),
+    so tp can share a cached result, interned vector or view with any equal tuple."""
+    for x in tp:
+        if type(x) is not int:
+            return False
+    return True
+
+def tonal_abs_diff_matrix(xs):
+    """Returns the tonal_abs_diff of every pair of values in xs, as a list of rows.
+    If any value has an octave designation, they are all treated as having one.
+
+    >>> tonal_abs_diff_matrix([(0,0), (2,4), (4,7)])
+    [[(0, 0), (2, 4), (3, 5)], [(2, 4), (0, 0), (2, 3)], [(3, 5), (2, 3), (0, 0)]]
+    """
+    xs = [tuple(x) for x in xs]
+    if any(len(x) == 3 for x in xs):
+        xs = [x if len(x) == 3 else (x[0], x[1], 0) for x in xs]
+    return [[_abs_diff_of(tonal_diff(x, y)) for y in xs] for x in xs]
+
+def interval_class_vector(xs):
+    """Returns the interval-class vector of the pitch classes in xs:
+    how many pairs of them are 1, 2, 3, 4, 5 and 6 half steps apart (in either direction).
+    Octave designations and repeated pitch classes are ignored.
+
+    >>> interval_class_vector([(0,0), (2,4), (4,7)]) # major triad
+    [0, 0, 1, 1, 1, 0]
+
+    >>> interval_class_vector([(0,0,0), (2,4,1), (4,7,-1), (0,0,2)])
+    [0, 0, 1, 1, 1, 0]
+    """
+    pcs = sorted(set(tonal_int(x) % C_LEN for x in xs))
+    icv = [0] * 6
+    for i, x in enumerate(pcs):
+        for y in pcs[i+1:]:
+            k = y - x
+            icv[min(k, C_LEN - k) - 1] += 1
+    return icv
+
 def abs_int_diff(x, y):
     """
     >>> abs_int_diff((0,1,0),(0,11,0))
@@ -390,12 +735,43 @@ def tonal_nearest_instance(x,y):
     c = y[1]
     o = x[2]
 
-    o = [o, o-1, o+1]
-
-    candidates = [(d,c,z) for z in o]
-    diff_candidates = {abs_int_diff(x, z):z for z in candidates}
+    # y in x's octave is delta half steps from x. Moving it an octave
+    # brings it closer once delta reaches half an octave (at exactly 6,
+    # the octave below or above wins, as it always has).
+    delta = tonal_int((d, c, o)) - tonal_int(x)
+    if delta >= 6:
+        return (d, c, o-1)
+    if delta <= -6:
+        return (d, c, o+1)
+    return (d, c, o)
+
+def tonal_resolve_octaves(x, ys):
+    """Returns a list with each of ys moved to the instance nearest the one before it,
+    starting from x (as tonal_nearest_instance does for one note).
+    This is how a melody written with relative octaves is placed.
+
+    >>> tonal_resolve_octaves((0,0,0), [(4,7), (3,5), (0,0), (5,9)])
+    [(4, 7, -1), (3, 5, -1), (0, 0, -1), (5, 9, -2)]
+    """
+    resolved = []
+    if len(x) == 2:
+        return [(y[0], y[1]) for y in ys]
 
-    return diff_candidates[min(diff_candidates.keys())]
+    x_int = tonal_int(x)
+    o = x[2]
+    for y in ys:
+        d, c = y[0], y[1]
+        y_int = tonal_int((d, c, o))
+        delta = y_int - x_int
+        if delta >= 6:
+            o -= 1
+            y_int -= C_LEN
+        elif delta <= -6:
+            o += 1
+            y_int += C_LEN
+        resolved.append((d, c, o))
+        x_int = y_int
+    return resolved
 
 def _tonal_unmodulo(x):
     """
@@ -424,4 +800,40 @@ def _tonal_unmodulo(x):
     try:
         return (d, c, x[2])
     except:
-        return (d, c)
\ No newline at end of file
+        return (d, c)
+
+
+### Lookup tables ###
+
+# Sums, differences and inversions of normalized tonal values,
+# keyed by (x_d, x_c, y_d, y_c).
+# Each entry is (d, c, o), where o is the octave carried by the operation,
+# to be added to whatever octave designations x and y have.
+
+def _build_tables():
+    # This is _tonal_sum written out for normalized values with octave 0,
+    # which keeps the import fast.
+    def modulo(d, c):
+        return (d % D_LEN, c % C_LEN, d // D_LEN)
+
+    chromae = [(d, c) for d in range(D_LEN) for c in range(C_LEN)]
+    sums, diffs, inversions = {}, {}, {}
+
+    for xd, xc in chromae:
+        for yd, yc in chromae:
+            key = (xd, xc, yd, yc)
+            sums[key] = modulo(xd + yd, xc + yc)
+            d, c, o = diffs[key] = modulo(xd - yd, xc - yc)
+            d, c, oo = modulo(yd - d, yc - c)
+            inversions[key] = (d, c, oo - o)
+
+    return sums, diffs, inversions
+
+_SUM_TABLE, _DIFF_TABLE, _INVERT_TABLE = _build_tables()
+
+# Half steps from the origin, keyed by (d, c).
+# _INT_TABLE is for octave-qualified values in octave 0,
+# _OCTAVELESS_INT_TABLE for values without an octave designation.
+
+_INT_TABLE = {(d, c): _tonal_int((d, c, 0)) for d in range(D_LEN) for c in range(C_LEN)}
+_OCTAVELESS_INT_TABLE = {(d, c): _tonal_int((d, c)) for d in range(D_LEN) for c in range(C_LEN)}
@@ -0,0 +1,380 @@
+"""
+Add and subtract intervals, chromae, notes --- a whole sequence at a time.
+
+A TonalArray holds many tonal primitives as integer NumPy columns:
+`d` (diatonic values), `c` (chromatic values) and,
+optionally, `o` (octave designations).
+
+The functions here mirror those in tonal_arithmetic,
+return the same values element by element,
+and broadcast the way NumPy arithmetic does.
+A TonalVector or tonal tuple broadcasts against a whole TonalArray.
+"""
+
+import itertools
+
+import numpy as np
+
+from ..definitions.constants import D_LEN, C_LEN, MS, MIDI_C0
+from . import tonal_arithmetic as ta
+from . import tonal_vector as tv
+
+_BASE_C = np.array([s.c for s in MS], dtype=np.int64)
+
+
+class TonalArray():
+    """An array of tonal primitives.
+
+    Like a tonal tuple, a TonalArray is not normalized when it is created.
+    The results of the arithmetic are.
+
+    Examples
+    --------
+
+    >>> voice = TonalArray.from_vectors([(0,0,0), (2,4,0), (4,7,0)])
+    >>> voice + (2,3)
+    TonalArray.from_vectors([(2, 3, 0), (4, 7, 0), (6, 10, 0)])
+
+    >>> (voice + (4,7)).to_vectors()[2]
+    TonalVector((1, 2, 1))
+
+    >>> voice.ints()
+    array([0, 4, 7])
+    """
+
+    __slots__ = ('d', 'c', 'o')
+
+    def __init__(self, d, c, o=None):
+        self.d = np.asarray(d, dtype=np.int64)
+        self.c = np.asarray(c, dtype=np.int64)
+        self.o = None if o is None else np.asarray(o, dtype=np.int64)
+
+    ### Conversion ###
+
+    @classmethod
+    def from_vectors(cls, vectors):
+        """Returns a TonalArray from an iterable of TonalVectors or tonal tuples,
+        all with or all without an octave designation.
+
+        >>> TonalArray.from_vectors([(0,0), (6,11)]).c
+        array([ 0, 11])
+        """
+        a = np.array(list(vectors), dtype=np.int64)
+
+        if a.size == 0:
+            return cls(a, a)
+
+        if a.ndim != 2 or a.shape[1] not in (2, 3):
+            raise TypeError("Tonal primitives have two or three values.")
+
+        return cls(*a.T)
+
+    @classmethod
+    def from_ints(cls, ints, spelling='sharp'):
+        """Returns an octave-qualified TonalArray from half step distances from the origin.
+        The spelling hint works as in tonal_arithmetic.tonal_from_int.
+
+        >>> TonalArray.from_ints([0, 13, -1], 'flat')
+        TonalArray.from_vectors([(0, 0, 0), (1, 1, 1), (6, 11, -1)])
+        """
+        spelled = ta._spelling_table(spelling)
+        base = np.array([ta._INT_TABLE[x] for x in spelled], dtype=np.int64)
+        spelled = np.array(spelled, dtype=np.int64)
+
+        ints = np.asarray(ints, dtype=np.int64)
+        pc = ints % C_LEN
+        return cls(spelled[pc, 0], spelled[pc, 1], (ints - base[pc]) // C_LEN)
+
+    @classmethod
+    def from_midi(cls, numbers, spelling='sharp'):
+        """Returns an octave-qualified TonalArray from MIDI note numbers.
+
+        >>> TonalArray.from_midi([60, 61, 71]).tolist()
+        [(0, 0, 0), (0, 1, 0), (6, 11, 0)]
+        """
+        return cls.from_ints(np.asarray(numbers, dtype=np.int64) - MIDI_C0, spelling)
+
+    def _columns(self):
+        if self.o is None:
+            return (self.d, self.c)
+        return (self.d, self.c, self.o)
+
+    def tolist(self):
+        """Returns the values as a flat list of tuples.
+
+        >>> TonalArray([0, 1], [1, 1]).tolist()
+        [(0, 1), (1, 1)]
+        """
+        columns = np.broadcast_arrays(*self._columns())
+        return list(zip(*(col.ravel().tolist() for col in columns)))
+
+    def to_vectors(self):
+        """Returns the values as a flat list of TonalVectors."""
+        return [tv.TonalVector(x) for x in self.tolist()]
+
+    ### Container ###
+
+    @property
+    def shape(self):
+        return np.broadcast(*self._columns()).shape
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __iter__(self):
+        return iter(self.to_vectors())
+
+    def __getitem__(self, key):
+        """
+        >>> voice = TonalArray.from_vectors([(0,0,0), (2,4,0), (4,7,0)])
+        >>> voice[1]
+        TonalVector((2, 4, 0))
+
+        >>> voice[1:]
+        TonalArray.from_vectors([(2, 4, 0), (4, 7, 0)])
+        """
+        columns = [col[key] for col in np.broadcast_arrays(*self._columns())]
+        if columns[0].ndim == 0:
+            return tv.TonalVector(tuple(int(col) for col in columns))
+        return self.__class__(*columns)
+
+    def __repr__(self):
+        return "TonalArray.from_vectors({})".format(self.tolist())
+
+    ### Tonal Arithmetic ###
+
+    def __add__(self, x):
+        return tonal_sum(self, x)
+
+    def __radd__(self, x):
+        return tonal_sum(x, self)
+
+    def __sub__(self, x):
+        return tonal_diff(self, x)
+
+    def __rsub__(self, x):
+        return tonal_diff(x, self)
+
+    def inversion(self, x=(0,0)):
+        return tonal_invert(self, x)
+
+    def distance(self, x):
+        return tonal_abs_diff(self, x)
+
+    def distance_matrix(self):
+        return tonal_abs_diff_matrix(self)
+
+    def interval_class_vector(self):
+        return interval_class_vector(self)
+
+    def ints(self):
+        return tonal_int(self)
+
+    def midi(self):
+        return midi_numbers(self)
+
+
+### Vectorized tonal arithmetic ###
+
+def tonal_sum(x, y):
+    """Returns the values of x augmented by y.
+
+    >>> tonal_sum(TonalArray([3, 6], [6, 11], [0, 1]), (4, 6))
+    TonalArray.from_vectors([(0, 0, 1), (3, 5, 2)])
+    """
+    return _wrap(_sum(_as_columns(x), _as_columns(y)))
+
+def tonal_diff(x, y):
+    """Returns the values of x diminished by y.
+
+    >>> tonal_diff(TonalArray([0, 0], [0, 1], [0, 0]), [(1,1,0), (6,10,-1)])
+    TonalArray.from_vectors([(6, 11, -1), (1, 3, 0)])
+    """
+    return _wrap(_diff(_as_columns(x), _as_columns(y)))
+
+def _tonal_modulo(x):
+    """Returns octave-normalized values of x.
+
+    >>> _tonal_modulo(TonalArray([7, -1], [12, -1], [0, 0]))
+    TonalArray.from_vectors([(0, 0, 1), (6, 11, -1)])
+    """
+    return _wrap(_modulo(_as_columns(x)))
+
+def tonal_int(x):
+    """Returns the distance in half steps of each value from the origin, as an array.
+
+    >>> tonal_int(TonalArray([4, 6, 0], [7, 11, 11], [2, -1, 0]))
+    array([31, -1, -1])
+    """
+    return _int(_as_columns(x))
+
+def midi_numbers(x):
+    """Returns the MIDI note number of each octave-qualified value, as an array.
+
+    >>> midi_numbers([(0,0,0), (5,9,0), (6,11,-1)])
+    array([60, 69, 59])
+    """
+    x = _as_columns(x)
+    if len(x) != 3:
+        raise TypeError("A MIDI number needs an octave designation.")
+    return _int(x) + MIDI_C0
+
+def tonal_invert(x, y=(0,0)):
+    """Returns the inversions of x on y.
+
+    >>> tonal_invert(TonalArray([2, 3], [4, 6]))
+    TonalArray.from_vectors([(5, 8), (4, 6)])
+    """
+    return _wrap(_invert(_as_columns(x), _as_columns(y)))
+
+def tonal_abs_diff(x, y):
+    """Returns the smallest differences between x and y.
+
+    >>> tonal_abs_diff(TonalArray([0, 6], [0, 0], [0, 0]), [(6,11,-1), (0,0,1)])
+    TonalArray.from_vectors([(1, 1, 0), (1, 0, 0)])
+    """
+    return _wrap(_abs_diff(_as_columns(x), _as_columns(y)))
+
+def tonal_abs_diff_matrix(x):
+    """Returns the smallest difference between every pair of values in x,
+    as a TonalArray of shape (len(x), len(x)).
+
+    >>> m = tonal_abs_diff_matrix(TonalArray([0, 2, 4], [0, 4, 7]))
+    >>> m.shape
+    (3, 3)
+
+    >>> m[0].tolist()
+    [(0, 0), (2, 4), (3, 5)]
+    """
+    x = tuple(col.ravel() for col in np.broadcast_arrays(*_as_columns(x)))
+    rows = tuple(col[:, None] for col in x)
+    cols = tuple(col[None, :] for col in x)
+
+    # The distance depends only on the difference, and a set of pitches
+    # has few distinct differences: look each one up once in tonal_arithmetic.
+    z = _diff(rows, cols)
+    code = z[0] * C_LEN + z[1]
+    if len(z) == 3:
+        code = code + z[2] * (D_LEN * C_LEN)
+    distinct, inverse = np.unique(code, return_inverse=True)
+    d, c = np.divmod(distinct % (D_LEN * C_LEN), C_LEN)
+    keys = zip(d.tolist(), c.tolist(), (distinct // (D_LEN * C_LEN)).tolist())
+    table = np.array([ta._abs_diff_of(k[:len(z)]) for k in keys], dtype=np.int64)
+    result = table[inverse.reshape(code.shape)]
+    return _wrap(tuple(result[..., i] for i in range(len(z))))
+
+def interval_class_vector(x):
+    """Returns the interval-class vector of the pitch classes in x, as a list
+    (see tonal_arithmetic.interval_class_vector).
+
+    >>> interval_class_vector(TonalArray([0, 2, 4, 6], [0, 4, 7, 10]))
+    [0, 1, 2, 1, 1, 1]
+    """
+    pcs = np.unique(_int(_as_columns(x)) % C_LEN)
+    k = (pcs[None, :] - pcs[:, None])[np.triu_indices(len(pcs), 1)]
+    ic = np.minimum(k, C_LEN - k)
+    return np.bincount(ic, minlength=7)[1:].tolist()
+
+
+### Column implementations ###
+
+# These take and return tuples of two or three broadcastable integer arrays,
+# and follow tonal_arithmetic step by step.
+
+def _as_columns(x):
+    if isinstance(x, TonalArray):
+        return x._columns()
+    if len(x) in (2, 3) and np.ndim(x[0]) == 0:
+        return tuple(np.asarray(v, dtype=np.int64) for v in x)
+    return TonalArray.from_vectors(x)._columns()
+
+def _wrap(x):
+    return TonalArray(*x)
+
+def _qualify_octave_as_needed(x, y):
+    if len(x) == len(y):
+        return x, y
+    return _qualify_octave(x), _qualify_octave(y)
+
+def _qualify_octave(x):
+    if len(x) == 3:
+        return x
+    return (x[0], x[1], np.zeros_like(x[0]))
+
+def _select(conditions, choices, default):
+    return tuple(
+        np.select(conditions, [choice[i] for choice in choices], default[i])
+        for i in range(len(default))
+    )
+
+def _sum(x, y):
+    if len(x) < len(y):
+        raise TypeError("An octave designation cannot be added to an abstract tonal value.")
+    return _modulo(tuple(xval+yval for xval,yval in itertools.zip_longest(x, y, fillvalue=0)))
+
+def _diff(x, y):
+    return _sum(x, tuple(-m for m in y))
+
+def _modulo(x):
+    d, c = x[0], x[1]
+    if len(x) == 2:
+        return (d % D_LEN, c % C_LEN)
+    return (d % D_LEN, c % C_LEN, x[2] + d // D_LEN)
+
+def _unmodulo(x):
+    d, c = x[0], x[1]
+    rel = c - _BASE_C[d]
+    c = np.where(rel > 6, c - C_LEN, np.where(rel < -6, c + C_LEN, c))
+    return (d, c) + tuple(x[2:])
+
+def _int(x):
+    if len(x) == 2:
+        return _unmodulo(x)[1]
+
+    d, c, o = x
+    base_c = _BASE_C[d]
+    c = np.where(c - base_c > 3, c - C_LEN, c)
+    c = np.where(c - base_c < -3, c + C_LEN, c)
+    return c + o * C_LEN
+
+def _invert(x, y):
+    x, y = _qualify_octave_as_needed(x, y)
+    return _diff(y, _diff(x, y))
+
+def _lesser_of(x, y):
+    x = _unmodulo(x)
+    y = _unmodulo(y)
+    x_int, y_int = _int(x), _int(y)
+
+    tie = x_int == y_int
+    return _select(
+        [tie & (x[0] < y[0]), tie, x_int < y_int],
+        [x, y, _modulo(x)],
+        _modulo(y)
+    )
+
+def _abs_val(x):
+    y = _invert(x, (0, 0))
+    same_d = x[0] == y[0]
+    x_neg = _unmodulo(x)[1] < 0
+    y_neg = _unmodulo(y)[1] < 0
+
+    if len(x) == 2:
+        return _select(
+            [same_d & x_neg, same_d & y_neg],
+            [y, x],
+            _lesser_of(x, y)
+        )
+
+    at_origin = same_d & (x[2] == 0) & (y[2] == 0)
+    return _select(
+        [x[2] < 0, y[2] < 0, at_origin & x_neg, at_origin & y_neg],
+        [y, x, y, x],
+        _lesser_of(x, y)
+    )
+
+def _abs_diff(x, y):
+    x, y = _qualify_octave_as_needed(x, y)
+    a = _abs_val(_diff(x, y))
+    b = _abs_val(_diff(y, x))
+    return _modulo(_lesser_of(a, b))
@@ -1,33 +1,124 @@
-from dotmap import DotMap
+import collections
+import functools
 
 from . import tonal_arithmetic as ta
 from . import interval_quality as iq
 from ..definitions.constants import D_LEN, C_LEN, MS, AC
+from ..utils.method_dispatch import methoddispatch
 
 class TonalVector(tuple):
-    #__slots__ = ['d', 'c','o', 'note', 'interval'
-    #            '_Q', '_has_octave']
-    
+    # tuple subclasses cannot carry per-instance slots,
+    # so d, c and o are read straight out of the tuple
+    # and the .note and .interval views are built on first access.
+    __slots__ = ()
+
     def __new__(cls, tp):
-        tp = ta._tonal_modulo(tp)
-        return super(TonalVector, cls).__new__(TonalVector, tp)
-        
-    def __init__(self, tp):
+        """Returns the interned vector for tp, creating it if needed.
 
-        self.d = self[0] # diatonic value
-        self.c = self[1] # chromatic value
-        self._Q = MS[self.d] # Q for source # rename?
-        
-        # if a third value (octave) supplied
-        try:
-            self.o = self[2]
-            self._has_octave = True
-        except IndexError:
-            self.o = None
-            self._has_octave = False
+        >>> TonalVector((7,12,0)) is TonalVector((0,0,1))
+        True
+
+        Only vectors of plain ints are interned,
+        so other element types (floats, NumPy integers) are kept as given.
+
+        >>> TonalVector((2.0, 4.0)), TonalVector((2, 4))
+        (TonalVector((2.0, 4.0)), TonalVector((2, 4)))
+        """
+        tp = tuple(ta._tonal_modulo(tp))
+        if ta._exact_ints(tp):
+            return _pool.get(tp)
+        return tuple.__new__(cls, tp)
+
+    ### Interning ###
+
+    @staticmethod
+    def pool_info():
+        """Returns the hits, misses, maxsize and currsize of the interning pool.
 
-        self.note = self.Note(self)
-        self.interval = self.Interval(self)
+        >>> TonalVector.pool_info()._fields
+        ('hits', 'misses', 'maxsize', 'currsize')
+        """
+        return _pool.info()
+
+    @staticmethod
+    def pool_clear():
+        """Empties the interning pool and resets its statistics."""
+        _pool.clear()
+
+    @staticmethod
+    def set_pool_size(maxsize):
+        """Sets how many octave-qualified vectors the interning pool keeps.
+        Octaveless vectors are always interned.
+        A maxsize of None makes the pool unbounded, 0 disables it.
+
+        >>> TonalVector.set_pool_size(-1)
+        Traceback (most recent call last):
+        ...
+        ValueError: The pool size must be None or at least 0.
+        """
+        _pool.resize(maxsize)
+
+    @property
+    def d(self):
+        """The diatonic value.
+
+        >>> TonalVector((2,4,1)).d
+        2
+        """
+        return self[0]
+
+    @property
+    def c(self):
+        """The chromatic value.
+
+        >>> TonalVector((2,4,1)).c
+        4
+        """
+        return self[1]
+
+    @property
+    def o(self):
+        """The octave designation, or None if there isn't one.
+
+        >>> TonalVector((2,4,1)).o
+        1
+
+        >>> TonalVector((2,4)).o is None
+        True
+        """
+        if len(self) == 3:
+            return self[2]
+        return None
+
+    @property
+    def _has_octave(self):
+        return len(self) == 3
+
+    @property
+    def _Q(self): # Q for source # rename?
+        return MS[self[0]]
+
+    @property
+    def note(self):
+        """The note-name view of the vector, built on first access.
+
+        >>> TonalVector((0,1)).note is TonalVector((0,1)).note
+        True
+        """
+        if ta._exact_ints(self):
+            return _note_view(self)
+        return TonalVector.Note(self)
+
+    @property
+    def interval(self):
+        """The interval view of the vector, built on first access.
+
+        >>> TonalVector((2,3,1)).interval is TonalVector((2,3,1)).interval
+        True
+        """
+        if ta._exact_ints(self):
+            return _interval_view(self)
+        return TonalVector.Interval(self)
 
     ### Util ###
 
@@ -125,14 +216,47 @@ class TonalVector(tuple):
         return ta.tonal_abs(self)
 
     def __int__(self):
-        """
+        """The half step value of the vector, as sort_key; looked up on each call, not cached.
+
         >>> int(TonalVector((0,0,-1)))
         -12
 
         >>> int(TonalVector((0,0,1)))
         12
         """
-        return ta.tonal_int(self)
+        return self.sort_key()
+
+    def sort_key(self):
+        """The half step value of the vector, read from the tonal_int tables.
+
+        The key isn't stored on the vector: a slotted tuple subclass has no
+        room for a per-instance cache, so each call is a table lookup.
+        sorted(vectors) without a key calls this (and dispatches on the
+        other operand) on every comparison; pass key=TonalVector.sort_key,
+        or use tonal_sort, so each vector is converted once.
+
+        >>> sorted([TonalVector((4,7,0)), TonalVector((0,0,1)), TonalVector((6,11,-1))], key=TonalVector.sort_key)
+        [TonalVector((6, 11, -1)), TonalVector((4, 7, 0)), TonalVector((0, 0, 1))]
+        """
+        if len(self) == 3:
+            return ta._INT_TABLE[self[0], self[1]] + self[2]*C_LEN
+        return ta._OCTAVELESS_INT_TABLE[self[0], self[1]]
+
+    @methoddispatch
+    def _coerce_int(self, x):
+        """The half step value of x, for comparisons."""
+        try:
+            return int(x)
+        except TypeError:
+            return ta.tonal_int(x)
+
+    @_coerce_int.register(int)
+    def _(self, x):
+        return x
+
+    @_coerce_int.register(tuple)
+    def _(self, x):
+        return ta.tonal_int(x)
 
     def __gt__(self, x):
         """
@@ -145,10 +269,7 @@ class TonalVector(tuple):
         >>> TonalVector((3,6,1)) > 6
         True
         """
-        try:
-            return int(self) > int(x)
-        except TypeError:
-            return int(self) > ta.tonal_int(x)
+        return self.sort_key() > self._coerce_int(x)
 
     def __lt__(self, x):
         """
@@ -161,10 +282,7 @@ class TonalVector(tuple):
         >>> TonalVector((3,6,1)) < 6
         False
         """
-        try:
-            return int(self) < int(x)
-        except TypeError:
-            return int(self) < ta.tonal_int(x)
+        return self.sort_key() < self._coerce_int(x)
 
     def inversion(self, x=(0,0)):
         """
@@ -196,12 +314,22 @@ class TonalVector(tuple):
         >>> int(TonalVector((0,1))) == int(TonalVector((1,1)))
         True
         """
-        if type(self) == type(x):
-            return tuple(self) == tuple(x)
+        return self._equals(x)
+
+    @methoddispatch
+    def _equals(self, x):
         return tuple(self) == x or int(self) == x
 
-    def __hash__(self):
-        return hash(tuple(self))
+    @_equals.register(int)
+    def _(self, x):
+        return self.sort_key() == x
+
+    @_equals.register(tuple)
+    def _(self, x):
+        return tuple.__eq__(self, x)
+
+    # Same value as hash(tuple(self)), without a Python level call.
+    __hash__ = tuple.__hash__
 
 
 
@@ -249,18 +377,7 @@ class TonalVector(tuple):
             1
             """
             
-            modifier = self._v.c - self._v._Q.c
-
-
-            if abs(modifier) > 4: # 4 = triple aug or triple dim
-                if self._v.c < self._v._Q.c:
-                    d_val_c = self._v._Q.c - C_LEN
-                if self._v.c > self._v._Q.c:
-                    d_val_c = self._v._Q.c + C_LEN
-                modifier = self._v.c - d_val_c
-
-            return modifier
-            
+            return _MODIFIER_VALUES[self._v[0], self._v[1]]
 
         @property
         def _modifier(self):
@@ -285,15 +402,10 @@ class TonalVector(tuple):
             >>> TonalVector((1,1,0)).note._unicode(4)
             'D♭4'
             """
-            ustr = self._ln
-
-            if self._modifier_value:
-                ustr = "".join([ustr, self._modifier.u])
-
-            if self._v._has_octave:
-                ustr = "".join([ustr, str(self._v.o + octave_modifier)])
-            
-            return ustr
+            v = self._v
+            if len(v) == 3:
+                return _SPELLINGS['unicode'][v[0], v[1]] + str(v[2] + octave_modifier)
+            return _SPELLINGS['unicode'][v[0], v[1]]
 
         @property
         def unicode(self):
@@ -341,15 +453,10 @@ class TonalVector(tuple):
             >>> TonalVector((1,1,0)).note._ascii(4)
             'Db4'
             """
-            astr = self._ln
-
-            if self._modifier_value:
-                astr = "".join([astr, self._modifier.a])
-
-            if self._v._has_octave:
-                astr = "".join([astr, str(self._v.o + octave_modifier)])
-            
-            return astr
+            v = self._v
+            if len(v) == 3:
+                return _SPELLINGS['ascii'][v[0], v[1]] + str(v[2] + octave_modifier)
+            return _SPELLINGS['ascii'][v[0], v[1]]
             
         @property
         def ascii(self):
@@ -398,7 +505,7 @@ class TonalVector(tuple):
             'bis'
             """
 
-            return "".join([self._ln.lower(), self._modifier.ly])
+            return _SPELLINGS['ly_chroma'][self._v[0], self._v[1]]
 
         @property
         def ly_abs8ve(self):
@@ -428,15 +535,10 @@ class TonalVector(tuple):
             'dis,,,,'
             """
 
-            if not self._v._has_octave:
-                return self.ly_chroma
-
-            if self._v.o < 0:
-                ostr = ","
-            else:
-                ostr = "'"
-
-            return "".join([self.ly_chroma, ostr*abs(self._v.o)])
+            v = self._v
+            if len(v) == 3:
+                return _SPELLINGS['ly_chroma'][v[0], v[1]] + _ly_octave(v[2])
+            return _SPELLINGS['ly_chroma'][v[0], v[1]]
 
 
         def ly_rel8ve(self, prev=None):
@@ -465,12 +567,7 @@ class TonalVector(tuple):
 
             octave_distance = self._v.o - closer_chroma.o
 
-            if octave_distance < 0:
-                ostr = ","
-            else:
-                ostr = "'"
-
-            return "".join([self.ly_chroma, ostr*abs(octave_distance)]) 
+            return self.ly_chroma + _ly_octave(octave_distance)
 
 
         @property
@@ -486,17 +583,10 @@ class TonalVector(tuple):
             'Csharp1'
 
             """ 
-            if self._v.o == None:
-                o = ""
-            else:
-                o = str(self._v.o)
-
-            if self._modifier_value == 0:
-                mod_text = ""
-            else:
-                mod_text = self._modifier.v
-
-            return "".join([self._ln, mod_text, o])
+            v = self._v
+            if len(v) == 3:
+                return _SPELLINGS['verbose'][v[0], v[1]] + str(v[2])
+            return _SPELLINGS['verbose'][v[0], v[1]]
 
         def __repr__(self):
             """
@@ -527,7 +617,7 @@ class TonalVector(tuple):
             3
             """
             self._v = vector
-            self.quality = iq._get_quality(vector)
+            self.quality = iq._vector_quality(vector)
             self.number = vector.d + 1
             
             try:
@@ -574,3 +664,186 @@ class TonalVector(tuple):
             """
             return "".join([self.unicode, " | ", str(tuple(self._v))])
 
+
+
+# Registered here, as the class doesn't exist inside its own body.
+@TonalVector._coerce_int.register(TonalVector)
+def _(self, x):
+    return x.sort_key()
+
+
+PoolInfo = collections.namedtuple('PoolInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class _VectorPool():
+    """Interns TonalVectors by value.
+
+    Octaveless vectors have only D_LEN * C_LEN normalized states, and are all kept.
+    Octave-qualified vectors are kept in a least recently used pool
+    of at most maxsize entries.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.clear()
+
+    def get(self, tp):
+        if len(tp) == 2:
+            try:
+                v = self._octaveless[tp]
+            except KeyError:
+                v = self._octaveless[tp] = self._new(tp)
+                self.misses += 1
+            else:
+                self.hits += 1
+            return v
+
+        try:
+            v = self._octaved[tp]
+        except KeyError:
+            v = self._new(tp)
+            self.misses += 1
+            if self.maxsize != 0:
+                self._octaved[tp] = v
+                if self.maxsize is not None and len(self._octaved) > self.maxsize:
+                    self._octaved.popitem(last=False)
+        else:
+            try:
+                self._octaved.move_to_end(tp)
+            except KeyError: # evicted by another thread since the lookup
+                pass
+            self.hits += 1
+        return v
+
+    @staticmethod
+    def _new(tp):
+        return tuple.__new__(TonalVector, tp)
+
+    def info(self):
+        currsize = len(self._octaveless) + len(self._octaved)
+        return PoolInfo(self.hits, self.misses, self.maxsize, currsize)
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self._octaveless = {}
+        self._octaved = collections.OrderedDict()
+
+    def resize(self, maxsize):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("The pool size must be None or at least 0.")
+        self.maxsize = maxsize
+        if maxsize is not None:
+            while len(self._octaved) > maxsize:
+                self._octaved.popitem(last=False)
+
+_pool = _VectorPool()
+
+
+# Equal vectors of plain ints are interchangeable, so the views are shared between them.
+
+@functools.lru_cache(maxsize=4096)
+def _note_view(vector):
+    return TonalVector.Note(vector)
+
+@functools.lru_cache(maxsize=4096)
+def _interval_view(vector):
+    return TonalVector.Interval(vector)
+
+
+### Spelling tables ###
+
+RENDER_STYLES = ('unicode', 'unicode_C4', 'ascii', 'ascii_C4', 'ly_chroma', 'ly_abs8ve', 'ly_rel8ve', 'verbose')
+
+def _build_spellings():
+    """Spells every (d, c) pair once, in each style, without an octave designation.
+    Pairs too far from their letter name to be spelled (more than 4 sharps or flats)
+    are left out of the spelling tables, so looking them up raises KeyError.
+    """
+    modifiers = {}
+    spellings = {'unicode': {}, 'ascii': {}, 'ly_chroma': {}, 'verbose': {}}
+    for d, degree in enumerate(MS):
+        for c in range(C_LEN):
+            modifier = c - degree.c
+            if abs(modifier) > 4: # 4 = quadruple aug or dim, so the note is across the octave break
+                modifier += C_LEN if modifier < 0 else -C_LEN
+            modifiers[d, c] = modifier
+
+            if modifier not in AC:
+                continue
+            ln, accidental = degree.ln.upper(), AC[modifier]
+            spellings['unicode'][d, c] = ln + accidental.u if modifier else ln
+            spellings['ascii'][d, c] = ln + accidental.a
+            spellings['ly_chroma'][d, c] = ln.lower() + accidental.ly
+            spellings['verbose'][d, c] = ln + accidental.v if modifier else ln
+    return modifiers, spellings
+
+_MODIFIER_VALUES, _SPELLINGS = _build_spellings()
+
+# style : (spelling table, octave_modifier)
+_OCTAVE_STYLES = {
+    'unicode': ('unicode', 0),
+    'unicode_C4': ('unicode', 4),
+    'ascii': ('ascii', 0),
+    'ascii_C4': ('ascii', 4),
+    'verbose': ('verbose', 0),
+}
+
+def _ly_octave(o):
+    """The Lilypond octave marks for o octaves up (') or down (,)."""
+    if o < 0:
+        return "," * -o
+    return "'" * o
+
+def render_many(vectors, style='unicode', sep=' '):
+    """Renders a sequence of note vectors (a voice) as a single string.
+
+    The style is the name of one of the TonalVector.Note spellings (see RENDER_STYLES).
+    For 'ly_rel8ve', each note is written relative to the one before it.
+
+    Examples
+    --------
+
+    >>> render_many([TonalVector((0,1,0)), TonalVector((1,1)), TonalVector((6,11,-1))])
+    'C♯0 D♭ B-1'
+
+    >>> render_many([(0,0,0), (4,7,0), (3,5,0)], 'ly_rel8ve')
+    "c g' f"
+
+    >>> render_many([(0,0,1), (2,3,1)], 'ascii_C4', sep=", ")
+    'C5, Eb5'
+
+    >>> render_many([(7,12,0)]) # normalized first, as TonalVector does
+    'C1'
+    """
+    # TonalVectors are already normalized
+    vectors = [v if type(v) is TonalVector else ta._tonal_modulo(v) for v in vectors]
+
+    if style == 'ly_rel8ve':
+        parts = []
+        prev = None
+        for v in vectors:
+            v = TonalVector(v)
+            parts.append(v.note.ly_rel8ve(prev))
+            prev = v
+        return sep.join(parts)
+
+    if style == 'ly_chroma':
+        names = _SPELLINGS['ly_chroma']
+        return sep.join([names[v[0], v[1]] for v in vectors])
+
+    if style == 'ly_abs8ve':
+        names = _SPELLINGS['ly_chroma']
+        return sep.join([
+            names[v[0], v[1]] + _ly_octave(v[2]) if len(v) == 3 else names[v[0], v[1]]
+            for v in vectors
+        ])
+
+    try:
+        table, octave_modifier = _OCTAVE_STYLES[style]
+    except KeyError:
+        raise ValueError("Style must be one of {}.".format(", ".join(RENDER_STYLES)))
+    names = _SPELLINGS[table]
+    return sep.join([
+        names[v[0], v[1]] + str(v[2] + octave_modifier) if len(v) == 3 else names[v[0], v[1]]
+        for v in vectors
+    ])
@@ -1,4 +1,3 @@
-import music21 as m
 import copy
 
 def play(x):
@@ -7,6 +6,8 @@ def play(x):
     Adds a rest before the first note so that the first note will play, 
     fixing a bug in the way Music21, midi, and web browsers interact.
     """
+    import music21 as m # slow to import, so only done when needed
+
     if isinstance(x, m.stream.Stream):
         x = copy.deepcopy(x)
         for subStream in x.recurse(streamsOnly=True, includeSelf=True):
@@ -1,22 +1,98 @@
 from fractions import Fraction as Frac
+import functools
 import itertools
-import math
 
 def pow2_floor_frac(x):
-    return Frac(2**math.floor(math.log2(x)))
+    """Returns the largest power of two not greater than x, as a Fraction.
+
+    >>> pow2_floor_frac(7)
+    Fraction(4, 1)
+
+    >>> pow2_floor_frac(Frac(3, 8))
+    Fraction(1, 4)
+    """
+    n, d = _ratio(x)
+    if n <= 0:
+        raise ValueError("math domain error")
+
+    # 2**e <= n/d < 2**(e+1), with e off by at most one from the difference in bit lengths
+    e = n.bit_length() - d.bit_length()
+    if (n << -e if e < 0 else n) < (d if e < 0 else d << e):
+        e -= 1
+    return _pow2_frac(e)
+
+@functools.lru_cache(maxsize=256)
+def _pow2_frac(e):
+    return Frac(1 << e) if e >= 0 else Frac(1, 1 << -e)
 
 def primes(start):
-    return (x for x in itertools.count(start) if all(
-                x % y != 0 for y in range(2, int(x ** 0.5) + 1)
-            ))
+    """Yields the primes from start up, with an incremental sieve of Eratosthenes.
+
+    Each prime p is added to the sieve when the candidates reach p*p,
+    so the sieve only holds the primes up to the square root of the candidate.
+
+    >>> list(itertools.islice(primes(10), 5))
+    [11, 13, 17, 19, 23]
+    """
+    for x in (2, 3, 5, 7):
+        if x >= start:
+            yield x
+
+    def mark(m, step):
+        while m in composites:
+            m += step
+        composites[m] = step
+
+    # composite : twice the prime it was marked by, for the next odd multiple of each prime added so far
+    composites = {}
+    base = primes(3)
+    p = next(base)
+    q = p * p
+
+    first = max(9, start + 1 - start % 2)
+    while q < first: # primes whose multiples below start are skipped
+        m = -(-first // p) * p
+        mark(m if m % 2 else m + p, 2 * p)
+        p = next(base)
+        q = p * p
+
+    for x in itertools.count(first, 2):
+        step = composites.pop(x, None)
+        if step is None:
+            if x < q:
+                yield x
+                continue
+            step = 2 * p # x is p*p
+            p = next(base)
+            q = p * p
+        mark(x + step, step)
 
 def is_pow2(x):
-    return math.log2(x).is_integer()
+    """Returns True if x is a power of two, including negative powers such as 1/4.
+
+    >>> is_pow2(8), is_pow2(Frac(1, 4)), is_pow2(Frac(3, 4))
+    (True, True, False)
+    """
+    n, d = _ratio(x)
+    if n <= 0:
+        raise ValueError("math domain error")
+    return not (n & (n - 1) or d & (d - 1))
 
 def divide_by_largest_pow2_factor(x):
-    for f in (2**n for n in itertools.count()):
-        if f > x/2:
-            break
-        if x%f == 0:
-            best_f = f
-    return int(x/best_f)
\ No newline at end of file
+    """Returns the odd part of a positive integer.
+
+    >>> divide_by_largest_pow2_factor(24)
+    3
+    """
+    x = int(x)
+    if x <= 0:
+        raise ValueError("math domain error")
+    return x >> ((x & -x).bit_length() - 1)
+
+def _ratio(x):
+    """Returns x as an exact (numerator, denominator) pair."""
+    try: # int, Fraction and their subclasses
+        return x.numerator, x.denominator
+    except AttributeError:
+        x = Frac(x)
+        return x.numerator, x.denominator
@@ -0,0 +1,52 @@
+import functools
+
+__all__ = ['ResizableLRUCache']
+
+
+class ResizableLRUCache():
+    """A functools.lru_cache around func, whose maxsize can be changed later.
+
+    Hot callers can call the underlying lru_cache wrapper, `cached`, directly.
+
+    Examples
+    --------
+
+    >>> square = ResizableLRUCache(lambda x: x*x, maxsize=2)
+    >>> square(3), square(3)
+    (9, 9)
+
+    >>> square.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+    >>> square.cache_resize(16)
+    >>> square.cache_info()
+    CacheInfo(hits=0, misses=0, maxsize=16, currsize=0)
+    """
+
+    def __init__(self, func, maxsize=128):
+        self.__wrapped__ = func
+        self.cached = functools.lru_cache(maxsize)(func)
+
+    def __call__(self, *args):
+        return self.cached(*args)
+
+    def cache_info(self):
+        """Returns the hits, misses, maxsize and currsize of the cache."""
+        return self.cached.cache_info()
+
+    def cache_clear(self):
+        """Empties the cache and resets its statistics."""
+        self.cached.cache_clear()
+
+    def cache_resize(self, maxsize):
+        """Replaces the cache with an empty one of the given maxsize.
+        A maxsize of None makes the cache unbounded, 0 disables it.
+
+        >>> ResizableLRUCache(abs).cache_resize(-1)
+        Traceback (most recent call last):
+        ...
+        ValueError: The cache size must be None or at least 0.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("The cache size must be None or at least 0.")
+        self.cached = functools.lru_cache(maxsize)(self.__wrapped__)
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+import omk_core as omk
+
+
+# Third party packages which `import omk_core` must not load.
+HEAVY_MODULES = ['music21', 'numpy', 'attr', 'dotmap']
+
+def imported_modules(statement):
+    code = "import sys; {}; print(' '.join(sys.modules))".format(statement)
+    output = subprocess.check_output([sys.executable, "-c", code], universal_newlines=True)
+    return set(output.split())
+
+@pytest.mark.parametrize("statement", [
+    "import omk_core",
+    "from omk_core import TonalVector, Pitch, Interval, NoteLength",
+])
+def test_import_stays_light(statement):
+    modules = imported_modules(statement)
+    for name in HEAVY_MODULES:
+        assert name not in modules
+
+def test_lazy_attributes():
+    assert omk.Note.__module__ == 'omk_core.note.note'
+    assert 'Note' in dir(omk)
+
+    with pytest.raises(AttributeError):
+        omk.NotAThing
+
+def test_eager_attributes_before_3_7():
+    # Simulate an interpreter without module __getattr__.
+    modules = imported_modules("import sys; sys.version_info = (3, 6, 0); "
+                               "import omk_core; omk_core.__dict__['Note']")
+    assert 'attr' in modules
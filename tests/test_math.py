@@ -0,0 +1,53 @@
+import pytest
+from hypothesis import given, assume
+from hypothesis.strategies import fractions, integers
+
+from fractions import Fraction as Frac
+import itertools
+
+from benchmarks.common import (reference_pow2_floor_frac, reference_primes,
+                               reference_is_pow2, reference_divide_by_largest_pow2_factor)
+from omk_core.utils import math as um
+
+
+positive_fractions = fractions(min_value=Frac(1, 2**12), max_value=2**20, max_denominator=2**12)
+
+@given(positive_fractions)
+def test_pow2_floor_frac(x):
+    assume(x > 0)
+    assert um.pow2_floor_frac(x) == reference_pow2_floor_frac(x)
+    assert um.pow2_floor_frac(x) <= x < 2 * um.pow2_floor_frac(x)
+
+@given(integers(-200, 200))
+def test_pow2_floor_frac_exact(e):
+    # log2 rounds just below large powers of two; the exact version doesn't.
+    x = Frac(2)**e
+    assert um.pow2_floor_frac(x) == x
+    assert um.pow2_floor_frac(x - Frac(1, 2**300)) == x / 2
+    assert um.pow2_floor_frac(2**200 - 1) == 2**199
+
+@given(positive_fractions)
+def test_is_pow2(x):
+    assume(x > 0)
+    assert um.is_pow2(x) == reference_is_pow2(x)
+    assert um.is_pow2(x.numerator) == reference_is_pow2(x.numerator)
+
+def test_is_pow2_exact():
+    assert um.is_pow2(2**2000)
+    assert not um.is_pow2(2**2000 + 1)
+    assert um.is_pow2(Frac(1, 2**2000))
+    with pytest.raises(ValueError):
+        um.is_pow2(0)
+
+@given(integers(1, 2**40))
+def test_divide_by_largest_pow2_factor(x):
+    odd = um.divide_by_largest_pow2_factor(x)
+    assert odd % 2 == 1
+    assert x % odd == 0 and um.is_pow2(x // odd)
+    if x > 1 and not um.is_pow2(x):
+        # The old loop returned 2 for powers of two, and failed for 1.
+        assert odd == reference_divide_by_largest_pow2_factor(x)
+
+@given(integers(2, 10**6))
+def test_primes(start):
+    assert list(itertools.islice(um.primes(start), 50)) == list(itertools.islice(reference_primes(start), 50))
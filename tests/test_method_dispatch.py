@@ -0,0 +1,64 @@
+import collections.abc
+
+from omk_core.utils.method_dispatch import methoddispatch
+
+
+class Describe():
+
+    @methoddispatch
+    def describe(self, x):
+        return "object"
+
+    @describe.register(int)
+    def _(self, x):
+        return "int"
+
+    @describe.register(tuple)
+    def _(self, x):
+        return "tuple"
+
+
+class Point(tuple):
+    pass
+
+
+def test_dispatch_counters():
+    d = Describe()
+    Describe.describe.cache_clear()
+    assert [d.describe(x) for x in (1, (1, 2), Point((1, 2)), Point((3, 4)), "x")] == \
+        ["int", "tuple", "tuple", "tuple", "object"]
+    info = Describe.describe.cache_info()
+    assert (info.hits, info.misses, info.mro_resolutions) == (3, 2, 2)
+
+
+def test_register_invalidates_cache():
+    class Generic():
+        @methoddispatch
+        def f(self, x):
+            return "object"
+
+    g = Generic()
+    assert g.f(Point()) == "object"
+    Generic.f.register(tuple, lambda self, x: "tuple")
+    assert g.f(Point()) == "tuple"
+    assert Generic.f.dispatch(Point) is Generic.f.registry[tuple]
+
+
+def test_abc_registration():
+    class Generic():
+        @methoddispatch
+        def f(self, x):
+            return "object"
+
+        @f.register(collections.abc.Sized)
+        def _(self, x):
+            return "sized"
+
+    class Thing():
+        pass
+
+    g = Generic()
+    assert g.f([]) == "sized"
+    assert g.f(Thing()) == "object"
+    collections.abc.Sized.register(Thing)
+    assert g.f(Thing()) == "sized"
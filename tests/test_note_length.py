@@ -3,6 +3,7 @@ from hypothesis import given, assume
 from hypothesis.strategies import sampled_from, decimals, floats, fractions, integers
 
 from fractions import Fraction as Frac
+from benchmarks.common import reference_undot, reference_untuple
 import omk_core as omk
 
 base_note_lengths = [omk.NoteLength(2,n) for n in [1,2,4,8,16,32,64,128,256]]
@@ -79,4 +80,51 @@ def test_tuple_repr(nl, tt):
 @given(sampled_from(base_note_lengths), integers(1,9))
 def test_dotted_repr(nl, d):
     rpr = nl.dot(d).__repr__()
-    assert rpr == "{}.dot({})".format(nl.__repr__(), str(d))
\ No newline at end of file
+    assert rpr == "{}.dot({})".format(nl.__repr__(), str(d))
+
+@given(sampled_from(note_lengths + [omk.NoteLength(n, 64) for n in range(1, 300)]))
+def test_closed_form_undot(x):
+    expected = reference_undot(x)
+    assert x._can_undot() == (expected is not None)
+    if expected is None:
+        with pytest.raises(ValueError):
+            x.undot()
+    else:
+        assert x.undot() == expected
+
+def test_closed_form_untuple():
+    # Every denominator up to 1024, and for powers of two an undotted numerator too.
+    for denominator in range(1, 1025):
+        numerators = (1, 5) if denominator & (denominator - 1) == 0 else (1,)
+        for numerator in numerators:
+            x = omk.NoteLength(numerator, denominator)
+            assert x.untuple() == reference_untuple(x)
+
+def test_untuple_limit():
+    assert omk.NoteLength(1, 3 * 2**20).untuple() == (omk.NoteLength(1, 2**21), 3)
+    assert omk.NoteLength(1, omk.rhythm.note_length.MAX_TUPLET - 1).untuple()[1] == 1023
+    with pytest.raises(ValueError):
+        omk.NoteLength(1, 1025).untuple()
+    assert repr(omk.NoteLength(1, 1025)) == "NoteLength(1, 1025)"
+
+def reference_repr(x, depth=8):
+    """The nested repr built from reference_untuple and reference_undot, or None where it never ends."""
+    if omk.utils.math.is_pow2(x):
+        return x._plain_repr()
+    base, tt = reference_untuple(x)
+    if tt is not None:
+        if depth == 0:
+            return None
+        base_repr = reference_repr(omk.NoteLength(base), depth - 1)
+        return base_repr and "NoteLength.TupletMember({}, {})".format(base_repr, tt)
+    base, dots = reference_undot(x)
+    return "{}.dot({})".format(base._plain_repr(), dots)
+
+def test_repr_round_trip():
+    for denominator in range(1, 33):
+        for numerator in range(1, 33):
+            x = omk.NoteLength(numerator, denominator)
+            assert eval(repr(x), {'NoteLength': omk.NoteLength}) == x
+            expected = reference_repr(x)
+            if expected is not None:
+                assert repr(x) == expected
@@ -0,0 +1,90 @@
+import io
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import sampled_from
+
+import omk_core as omk
+from omk_core.tonal_algebra import pitch as p
+from omk_core.tonal_algebra import interval as i
+from omk_core.tonal_algebra import interval_quality as iq
+
+letters = list("abcdefgABCDEFG")
+modifiers = ["", "#", "b", "##", "sharp", "flat", "♯", "♭", "es", "is", "isis"]
+octaves = ["", "0", "3", "-1", "'", "''", ",", ",,"]
+
+
+@given(sampled_from(letters), sampled_from(modifiers), sampled_from(octaves))
+def test_cached_parse(letter, modifier, octave):
+    nstr = letter + modifier + octave
+    assert p.pitch_to_tuple(nstr) == p._pitch_to_tuple(nstr)
+    assert p.pitch_to_tuple(nstr) == p._pitch_to_tuple(nstr)
+
+def test_cache_statistics():
+    p.pitch_cache.cache_clear()
+    for _ in range(3):
+        omk.Pitch("Db3")
+        omk.Pitch("c5", "c4")
+    info = p.pitch_cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 2, 2)
+
+    p.pitch_cache.cache_resize(1)
+    try:
+        omk.Pitch("Db3")
+        omk.Pitch("c5", "c4")
+        assert p.pitch_cache.cache_info().currsize == 1
+    finally:
+        p.pitch_cache.cache_resize(4096)
+
+def test_relative_parse_is_not_cached():
+    p.pitch_cache.cache_clear()
+    c0 = omk.Pitch("c4", "c4")
+    assert omk.Pitch("a'", c0) == (5, 9, 0)
+    assert omk.Pitch("a'", omk.Pitch("c", c0)) == (5, 9, 0)
+    assert omk.Pitch("a'", omk.Pitch("g4", "c4")) == (5, 9, 1)
+    assert p.pitch_cache.cache_info().currsize == 2
+
+def test_cached_interval_parse():
+    i.interval_cache.cache_clear()
+    assert omk.Interval("P5") is omk.Interval("P5")
+    assert i.interval_cache.cache_info().hits == 1
+
+def test_quality_aliases():
+    for (alias, d), quality in iq._quality_aliases.items():
+        assert iq._scan_quality(alias, d) is quality
+        assert iq._get_quality(alias.upper() if len(alias) > 1 else alias, d) is quality
+
+@pytest.mark.parametrize('istr, expected', [
+    ("M3", (2, 4)), ("m3", (2, 3)), ("MAJ3", (2, 4)), ("Min 6, -1", (5, 8, -1)),
+    ("A4", (3, 6)), ("d5", (4, 6)), ("dblaug4", (3, 7)), ("P1 +1", (0, 0, 1)),
+])
+def test_interval_qualities(istr, expected):
+    assert i._interval_to_tuple(istr) == expected
+
+def test_every_spelling_parses():
+    for s in omk.definitions.constants.MS:
+        for halfsteps, ac in omk.definitions.constants.AC.items():
+            for spelling in [x for x in set(ac.values()) if " " not in x]:
+                assert p._pitch_to_tuple(s.ln + spelling) == (s.d, s.c + halfsteps)
+                assert p._pitch_to_tuple(s.ln.upper() + spelling.upper() + "2") == (s.d, s.c + halfsteps, 2)
+
+melody = "c d e f g a b c' b, a g f e d c, c' d'' e,,"
+
+def test_streaming_relative():
+    context = omk.Pitch("c", (0, 0, 0))
+    expected = []
+    for token in melody.split():
+        context = omk.Pitch(token, context)
+        expected.append(context)
+
+    assert list(omk.Pitches(melody, (0, 0, 0))) == expected
+    assert list(p.pitches_to_tuples(io.StringIO(melody.replace(" ", "\n")), (0, 0, 0))) == expected
+
+def test_streaming_is_lazy():
+    def lines():
+        yield "c4 d4"
+        raise AssertionError("read too far")
+
+    stream = omk.Pitches(lines(), 'c4')
+    assert next(stream) == (0, 0, 0)
+    assert next(stream) == (1, 2, 0)
@@ -0,0 +1,71 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from, integers
+
+from fractions import Fraction as Frac
+import omk_core as omk
+
+base_note_lengths = [omk.NoteLength(1,n) for n in [1,2,4,8,16,32]]
+note_lengths = (base_note_lengths
+                + [nl.dot(d) for d in range(1, 4) for nl in base_note_lengths]
+                + [omk.NoteLength.TupletMember(nl, tt) for tt in range(3, 8) for nl in base_note_lengths])
+time_signatures = [omk.TimeSignature(n, d) for n in range(1, 13) for d in [2, 4, 8, 16]]
+
+
+@given(lists(sampled_from(note_lengths), max_size=50), integers(1, 4))
+def test_round_trip(xs, multiple):
+    ticks = omk.TickLengths.from_note_lengths(xs)
+    assert ticks.to_note_lengths() == xs
+    assert all(type(x) is omk.NoteLength for x in ticks.to_note_lengths())
+
+    rescaled = omk.TickLengths.from_note_lengths(xs, ppq=ticks.ppq * multiple)
+    assert rescaled.to_note_lengths() == xs
+    assert rescaled == ticks
+
+@given(lists(sampled_from(note_lengths), max_size=50))
+def test_total_and_offsets(xs):
+    ticks = omk.TickLengths.from_note_lengths(xs)
+    assert ticks.note_length(ticks.total()) == sum(xs, Frac(0))
+    assert [ticks.note_length(t) for t in ticks.offsets()] == [sum(xs[:i], Frac(0)) for i in range(len(xs))]
+
+@given(lists(sampled_from(note_lengths), max_size=50), sampled_from(time_signatures))
+def test_measures(xs, ts):
+    ticks = omk.TickLengths.from_note_lengths(xs, ppq=omk.TickLengths.from_note_lengths(xs + [ts]).ppq)
+    measures = ticks.measures(ts)
+
+    bar = omk.TickLengths.from_note_lengths([ts], ppq=ticks.ppq).total()
+    assert all(sum(t for _, t in m) == bar for m in measures[:-1])
+    assert 0 < sum(t for _, t in measures[-1]) <= bar if measures else xs == []
+
+    # Putting the split notes back together gives the original sequence.
+    rejoined = [0] * len(xs)
+    for m in measures:
+        for i, t in m:
+            rejoined[i] += t
+    assert rejoined == ticks.ticks
+
+def test_ppq_too_coarse():
+    with pytest.raises(ValueError):
+        omk.TickLengths.from_note_lengths([omk.NoteLength.TupletMember(omk.NoteLength(1, 8), 3)], ppq=256)
+    with pytest.raises(ValueError):
+        omk.TickLengths([1, 1], ppq=1).measures(omk.TimeSignature(3, 8))
+
+@given(lists(sampled_from(note_lengths), max_size=50))
+def test_note_offsets(xs):
+    offsets, total, ppq = omk.note_offsets(xs)
+    assert omk.NoteLength(total, 4 * ppq) == sum(xs, Frac(0))
+    assert [omk.NoteLength(t, 4 * ppq) for t in offsets] == [sum(xs[:i], Frac(0)) for i in range(len(xs))]
+
+@given(lists(sampled_from(note_lengths), max_size=50))
+def test_note_offsets_array(xs):
+    np = pytest.importorskip("numpy")
+    offsets, total, ppq = omk.note_offsets(xs, array=True)
+    assert offsets.dtype == np.int64
+    assert (offsets.tolist(), total, ppq) == omk.note_offsets(xs)
+
+def test_offsets_and_total_array():
+    np = pytest.importorskip("numpy")
+    offsets, total = omk.TickLengths([3, 1, 4], ppq=2).offsets_and_total(array=True)
+    assert isinstance(offsets, np.ndarray)
+    assert (offsets.tolist(), total) == ([0, 3, 4], 8)
+    assert omk.TickLengths([], ppq=1).offsets_and_total(array=True)[1] == 0
@@ -1,5 +1,8 @@
+import functools
+
 import pytest
 
+from benchmarks.common import reference_nearest_instance
 from test_fixtures import tonal_tuples, tonal_oct_tuples
 import omk_core as omk
 
@@ -95,4 +98,129 @@ def test_negative_tuple(tonal_tuples, tonal_oct_tuples):
 
     for x in tonal_oct_tuples:
         neg_x = tonal_arithmetic._negative_tuple(x)
-        assert omk.tonal_sum(x, neg_x) == (0,0,0)
\ No newline at end of file
+        assert omk.tonal_sum(x, neg_x) == (0,0,0)
+
+def test_lookup_tables():
+    """The table-driven kernel gives the same results as the general implementation."""
+    chromae = [(d, c) for d in range(7) for c in range(12)]
+    octaves = [(), (0,), (3,), (-2,)]
+
+    def diff(x, y):
+        return tonal_arithmetic._tonal_sum(x, tonal_arithmetic._negative_tuple(y))
+
+    for x in chromae:
+        for y in chromae:
+            for xo in octaves:
+                for yo in octaves:
+                    a, b = x + xo, y + yo
+                    if len(a) < len(b):
+                        continue
+                    assert omk.tonal_sum(a, b) == tonal_arithmetic._tonal_sum(a, b)
+                    assert omk.tonal_diff(a, b) == diff(a, b)
+
+                    a, b = omk.qualify_octave_as_needed(a, b)
+                    assert omk.tonal_invert(a, b) == diff(b, diff(a, b))
+
+def test_tonal_int_table():
+    chromae = [(d, c) for d in range(7) for c in range(12)]
+    for x in chromae:
+        assert omk.tonal_int(x) == tonal_arithmetic._tonal_int(x)
+        for o in (-2, 0, 3):
+            assert omk.tonal_int(x + (o,)) == tonal_arithmetic._tonal_int(x + (o,))
+
+def test_ints_round_trip(tonal_oct_tuples):
+    ints = omk.tonal_ints(tonal_oct_tuples)
+    assert omk.midi_numbers(tonal_oct_tuples) == [i + 60 for i in ints]
+    assert omk.midi_numbers(x for x in tonal_oct_tuples) == [i + 60 for i in ints]
+    assert omk.midi_numbers(x for x in [(0, 0, 0), (0, -1, 0)]) == [60, 59]
+    with pytest.raises(TypeError):
+        omk.midi_numbers(iter([(0, 0, 0), (1, 2, 0), (0, 0)]))
+
+    for spelling in ('sharp', 'flat'):
+        spelled = omk.tonal_from_ints(ints, spelling)
+        assert omk.tonal_ints(spelled) == ints
+        assert omk.tonal_from_midi(omk.midi_numbers(spelled), spelling) == spelled
+
+    double_flats = [(1, 0), (1, 1), (2, 2), (2, 3), (3, 4), (4, 5), (4, 6), (5, 7), (5, 8), (6, 9), (6, 10), (0, 11)]
+    spelled = omk.tonal_from_ints(ints, double_flats)
+    assert omk.tonal_ints(spelled) == ints
+
+def test_tonal_sort(tonal_tuples, tonal_oct_tuples):
+    for xs in (tonal_tuples, tonal_oct_tuples):
+        ordered = omk.tonal_sort(xs)
+        for x, y in zip(ordered, ordered[1:]):
+            assert omk.tonal_greater_of(x, y) == y
+        assert [xs[i] for i in omk.tonal_argsort(xs)] == ordered
+        assert omk.tonal_sort(xs, reverse=True) == ordered[::-1]
+        assert omk.tonal_min(xs) == ordered[0]
+        assert omk.tonal_max(xs) == ordered[-1]
+        assert omk.tonal_max(xs) == functools.reduce(omk.tonal_greater_of, xs)
+
+def test_nearest_instance_closed_form():
+    pairs = [(d, c) for d in range(7) for c in range(12)]
+    xs = pairs + [(d, c, o) for d, c in pairs for o in (-2, 0, 3)]
+    ys = pairs + [(d, c, o) for d, c in pairs for o in (-1, 4)]
+    for x in xs:
+        for y in ys:
+            assert omk.tonal_nearest_instance(x, y) == reference_nearest_instance(x, y)
+
+def test_resolve_octaves(tonal_tuples):
+    melody = tonal_tuples + tonal_tuples[::-3] + tonal_tuples[::2]
+    for start in [(0, 0, 0), (4, 7, -2), (6, 0, 1), (2, 4)]:
+        expected, prev = [], start
+        for y in melody:
+            prev = reference_nearest_instance(prev, y)
+            expected.append(prev)
+        assert omk.tonal_resolve_octaves(start, melody) == expected
+
+def test_transpose(tonal_tuples, tonal_oct_tuples):
+    for y in tonal_tuples + [(7, 12), (-1, -1)]:
+        for xs in (tonal_tuples, tonal_oct_tuples):
+            assert list(omk.tonal_transpose(iter(xs), y)) == [omk.tonal_sum(x, y) for x in xs]
+    for y in tonal_oct_tuples:
+        assert list(omk.tonal_transpose(iter(tonal_oct_tuples), y)) == [omk.tonal_sum(x, y) for x in tonal_oct_tuples]
+    intervals = tonal_oct_tuples[::-1]
+    assert list(omk.tonal_transpose(tonal_oct_tuples, iter(intervals))) == \
+        [omk.tonal_sum(x, y) for x, y in zip(tonal_oct_tuples, intervals)]
+
+def test_transpose_interval_forms(tonal_oct_tuples):
+    for y in ([4, 7], [4, 7, -1], omk.TonalVector((4, 7))):
+        assert list(omk.tonal_transpose(tonal_oct_tuples, y)) == [omk.tonal_sum(x, tuple(y)) for x in tonal_oct_tuples]
+    with pytest.raises(ValueError):
+        list(omk.tonal_transpose(tonal_oct_tuples, iter(tonal_oct_tuples[1:])))
+    with pytest.raises(ValueError):
+        list(omk.tonal_transpose(tonal_oct_tuples[1:], tonal_oct_tuples))
+
+def test_transpose_is_lazy():
+    def part():
+        yield (0, 0, 0)
+        raise RuntimeError("read past the first value")
+    assert next(omk.tonal_transpose(part(), (4, 7))) == (4, 7, 0)
+    with pytest.raises(TypeError):
+        list(omk.tonal_transpose([(0, 0)], (4, 7, 1)))
+
+def test_abs_diff_of_difference():
+    pairs = [(d, c) for d in range(7) for c in range(12)]
+    for xs in (pairs, [(d, c, o) for d, c in pairs for o in (-1, 0, 2)]):
+        for x in xs:
+            for y in xs[::5]:
+                a = omk.tonal_abs_val(omk.tonal_diff(x, y))
+                b = omk.tonal_abs_val(omk.tonal_diff(y, x))
+                assert omk.tonal_abs_diff(x, y) == tonal_arithmetic._tonal_modulo(omk.tonal_lesser_of(a, b))
+
+def test_abs_diff_keeps_element_types():
+    assert omk.tonal_abs_diff((0, 0, 0.0), (4, 7, 0)) == (4, 7, 0)
+    result = omk.tonal_abs_diff((0, 0, 0), (4, 7, 0))
+    assert all(type(v) is int for v in result)
+
+def test_abs_diff_matrix(tonal_tuples, tonal_oct_tuples):
+    for xs in (tonal_tuples, tonal_oct_tuples):
+        matrix = omk.tonal_abs_diff_matrix(xs)
+        assert matrix == [[omk.tonal_abs_diff(x, y) for y in xs] for x in xs]
+    mixed = omk.tonal_abs_diff_matrix(tonal_tuples[:5] + tonal_oct_tuples[:5])
+    assert mixed == omk.tonal_abs_diff_matrix([x + (0,) for x in tonal_tuples[:5]] + tonal_oct_tuples[:5])
+
+def test_interval_class_vector():
+    assert omk.interval_class_vector([(0, 0), (1, 2), (2, 4), (3, 5), (4, 7), (5, 9), (6, 11)]) == [2, 5, 4, 3, 6, 1]
+    assert omk.interval_class_vector([(0, 0), (0, 1), (6, 0, 3)]) == [1, 0, 0, 0, 0, 0]
+    assert omk.interval_class_vector([]) == [0] * 6
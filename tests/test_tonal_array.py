@@ -0,0 +1,66 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import omk_core as omk
+from omk_core.tonal_algebra import tonal_arithmetic as ta
+from omk_core.tonal_algebra import tonal_array as tarr
+
+from test_set import tonal_tuples, tonal_oct_tuples
+
+
+def pairs(xs, ys):
+    return [x for x in xs for y in ys], [y for x in xs for y in ys]
+
+@pytest.mark.parametrize("xs, ys", [
+    (tonal_tuples, tonal_tuples),
+    (tonal_oct_tuples, tonal_oct_tuples),
+    (tonal_oct_tuples, tonal_tuples),
+])
+def test_matches_tonal_arithmetic(xs, ys):
+    """Every vectorized function gives the same values as its scalar counterpart."""
+    xs, ys = pairs(xs, ys)
+    x, y = omk.TonalArray.from_vectors(xs), omk.TonalArray.from_vectors(ys)
+
+    assert tarr.tonal_sum(x, y).tolist() == [ta.tonal_sum(a, b) for a, b in zip(xs, ys)]
+    assert tarr.tonal_diff(x, y).tolist() == [ta.tonal_diff(a, b) for a, b in zip(xs, ys)]
+    assert tarr.tonal_invert(x, y).tolist() == [ta.tonal_invert(a, b) for a, b in zip(xs, ys)]
+    assert tarr.tonal_abs_diff(x, y).tolist() == [ta.tonal_abs_diff(a, b) for a, b in zip(xs, ys)]
+    assert tarr.tonal_int(x).tolist() == [ta.tonal_int(a) for a in xs]
+
+def test_broadcasting():
+    x = omk.TonalArray.from_vectors(tonal_oct_tuples)
+    y = omk.TonalVector((2, 3))
+
+    assert (x + y).to_vectors() == [v + y for v in x]
+    assert (x - y).to_vectors() == [v - y for v in x]
+
+    matrix = tarr.tonal_abs_diff(x[:, None], x[None, :])
+    assert matrix.shape == (len(x), len(x))
+
+def test_round_trip():
+    x = omk.TonalArray.from_vectors(tonal_oct_tuples)
+    assert x.tolist() == tonal_oct_tuples
+    assert x.to_vectors() == [omk.TonalVector(v) for v in tonal_oct_tuples]
+
+    with pytest.raises(TypeError):
+        tarr.tonal_sum(omk.TonalArray.from_vectors(tonal_tuples), (0, 0, 0))
+
+def test_ints_and_midi():
+    x = omk.TonalArray.from_vectors(tonal_oct_tuples)
+    assert x.midi().tolist() == omk.midi_numbers(tonal_oct_tuples)
+
+    for spelling in ('sharp', 'flat'):
+        y = omk.TonalArray.from_ints(x.ints(), spelling)
+        assert y.tolist() == omk.tonal_from_ints(x.ints().tolist(), spelling)
+        assert omk.TonalArray.from_midi(x.midi(), spelling).tolist() == y.tolist()
+
+@pytest.mark.parametrize("xs", [tonal_tuples, tonal_oct_tuples])
+def test_distance_matrix(xs):
+    matrix = omk.TonalArray.from_vectors(xs).distance_matrix()
+    assert matrix.shape == (len(xs), len(xs))
+    assert matrix.tolist() == [x for row in ta.tonal_abs_diff_matrix(xs) for x in row]
+
+def test_interval_class_vector():
+    for xs in (tonal_tuples, tonal_oct_tuples[::3], tonal_tuples[:4], tonal_tuples[:1]):
+        assert omk.TonalArray.from_vectors(xs).interval_class_vector() == ta.interval_class_vector(xs)
@@ -1,8 +1,11 @@
+import json
+
 import pytest
 from hypothesis import given
 from hypothesis.strategies import sampled_from
 
 import omk_core as omk
+from omk_core.tonal_algebra import interval_quality as iq
 
 from test_set import tonal_vectors, tonal_oct_vectors, tonal_tuples, tonal_oct_tuples
 
@@ -65,6 +68,97 @@ def test_hash_and_eq(x):
     assert x == y
     assert len(set([x, y]))
 
+@given(sampled_from(tonal_tuples+tonal_oct_tuples))
+def test_slots_and_lazy_views(x):
+    y = omk.TonalVector(x)
+    assert not hasattr(y, '__dict__')
+    assert (y.d, y.c) == x[:2]
+    assert y.o == (x[2] if len(x) == 3 else None)
+    assert y.note._v == y
+    assert y.interval._v == y
+    assert y.note is omk.TonalVector(x).note
+
+@given(sampled_from(tonal_tuples+tonal_oct_tuples), sampled_from(tonal_tuples))
+def test_interning(x, y):
+    assert omk.TonalVector(x) is omk.TonalVector(x)
+    assert omk.TonalVector(x) + y is omk.TonalVector(omk.tonal_sum(x, y))
+
+def test_interning_keeps_element_types():
+    omk.TonalVector.pool_clear()
+    floats = omk.TonalVector((2.0, 4.0))
+    ints = omk.TonalVector((2, 4))
+    assert floats is not ints
+    assert all(type(x) is int for x in ints)
+    assert ints.note._ln == 'E'
+    assert json.dumps(ints) == '[2, 4]'
+
+    np = pytest.importorskip("numpy")
+    from_numpy = omk.TonalVector(np.array([4, 7, 0]))
+    assert from_numpy == (4, 7, 0)
+    ints = omk.TonalVector((4, 7, 0))
+    assert ints is not from_numpy
+    assert json.dumps(ints) == '[4, 7, 0]'
+    assert repr(ints) == 'TonalVector((4, 7, 0))'
+
+def test_pool_size():
+    omk.TonalVector.pool_clear()
+    omk.TonalVector.set_pool_size(10)
+    try:
+        for x in tonal_oct_tuples:
+            omk.TonalVector(x)
+        info = omk.TonalVector.pool_info()
+        assert info.misses == len(tonal_oct_tuples)
+        assert info.currsize == 10
+        omk.TonalVector(tonal_oct_tuples[-1])
+        assert omk.TonalVector.pool_info().hits == info.hits + 1
+    finally:
+        omk.TonalVector.set_pool_size(1024)
+
+def test_pool_size_must_not_be_negative():
+    with pytest.raises(ValueError):
+        omk.TonalVector.set_pool_size(-1)
+    assert omk.TonalVector.pool_info().maxsize == 1024
+    assert omk.TonalVector((0, 0, 5)) is omk.TonalVector((0, 0, 5))
+
+@pytest.mark.parametrize('style', omk.tonal_algebra.tonal_vector.RENDER_STYLES)
+def test_render_many(style):
+    voice = tonal_vectors + tonal_oct_vectors
+    if style == 'ly_rel8ve':
+        voice = tonal_oct_vectors
+        expected = [voice[0].note.ly_rel8ve()]
+        expected += [y.note.ly_rel8ve(x) for x, y in zip(voice, voice[1:])]
+    else:
+        expected = [getattr(x.note, style) for x in voice]
+    assert omk.render_many(voice, style).split(" ") == expected
+    assert omk.render_many([tuple(x) for x in voice], style, sep="\n") == "\n".join(expected)
+    unnormalized = [(x[0] + 7, x[1] + 12, x[2] - 1) if len(x) == 3 else (x[0] - 7, x[1] - 12) for x in voice]
+    assert omk.render_many(unnormalized, style).split(" ") == expected
+
+def test_quality_table():
+    for d in range(7):
+        for c in range(12):
+            try:
+                q = omk.TonalVector((d, c)).interval.quality
+            except KeyError:
+                assert (d, c) not in iq._vector_qualities
+            else:
+                assert q is iq._get_quality((d, c)) is iq._get_quality((d, c, 3))
+                assert q is iq._get_quality(iq._quality_value(d, c))
+
+@given(sampled_from(tonal_vectors + tonal_oct_vectors), sampled_from(tonal_tuples + tonal_oct_tuples + list(range(-13, 14))))
+def test_mixed_comparisons(x, y):
+    y_int = omk.tonal_int(y) if isinstance(y, tuple) else y
+    assert (x < y) == (int(x) < y_int)
+    assert (x > y) == (int(x) > y_int)
+    assert (x == y) == (tuple(x) == y if isinstance(y, tuple) else int(x) == y)
+
+def test_sort_key():
+    vectors = tonal_oct_vectors + tonal_vectors
+    assert sorted(vectors, key=omk.TonalVector.sort_key) == sorted(vectors)
+    assert [x.sort_key() for x in vectors] == [omk.tonal_int(x) for x in vectors]
+    mixed = sorted(vectors + [5, -7, 30])
+    assert [int(x) for x in mixed] == sorted(int(x) for x in mixed)
+
 
 ## TonalVector.Note
 ## TonalVector.Interval